@@ -0,0 +1,659 @@
+# app/service/video/ffmpeg_utils.py
+# 포스터/마스코트/기타 홍보 영상이 같이 쓰는 FFmpeg / 인트로 헬퍼
+
+import os
+import json
+import subprocess
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 영상 메타데이터를 ffprobe 프로세스 없이 읽기 위한 PyAV (없으면 ffprobe 사용)
+try:
+    import av
+except ImportError:
+    av = None
+
+
+# 진행 로그(-stats)/배너를 끄고 에러만 stderr 로 받는다 → 파이프 버퍼가 커지지 않음
+FFMPEG_LOG_ARGS = ["-hide_banner", "-nostats", "-loglevel", "error"]
+
+# subprocess 타임아웃 (초)
+FFMPEG_INTRO_TIMEOUT_S = 300
+FFMPEG_TIMEOUT_S = 600
+FFPROBE_TIMEOUT_S = 30
+
+
+class FFmpegTimeoutError(RuntimeError):
+    """ffmpeg가 제한 시간 안에 끝나지 않았을 때 (호출 측에서 재시도 판단용)"""
+
+
+# 재인코딩 기본값: libx264 기본 preset (각 영상 모듈이 원래 쓰던 설정)
+LIBX264_ENCODER_ARGS = ["-c:v", "libx264"]
+# 1 이면 기본값 대신 하드웨어 인코더 / libx264 veryfast 를 사용 (같은 비트레이트에서 화질은 낮아짐)
+FFMPEG_FAST_ENCODE = os.getenv("FFMPEG_FAST_ENCODE") == "1"
+
+# 하드웨어 H.264 인코더 우선순위 + 인코더별 품질 옵션 (없으면 libx264)
+_H264_ENCODER_ARGS = {
+    "h264_nvenc": ["-preset", "p4", "-rc", "vbr", "-cq", "23"],
+    "h264_videotoolbox": ["-q:v", "50"],
+    "h264_qsv": ["-global_quality", "23"],
+    "libx264": ["-preset", "veryfast"],
+}
+
+_HW_H264_ENCODERS = frozenset({"h264_nvenc", "h264_videotoolbox", "h264_qsv"})
+# 배치 실행 시 하드웨어 인코더 동시 세션 상한 (스레드에서 도는 ffmpeg 끼리 공유)
+_HW_ENCODE_SLOTS = threading.BoundedSemaphore(int(os.getenv("HW_ENCODE_MAX_SESSIONS", "3")))
+
+
+@lru_cache(maxsize=1)
+def _pick_h264_encoder() -> str:
+    """
+    사용 가능한 H.264 인코더를 한 번만 골라 캐시.
+    - ffmpeg -encoders 목록에 있어도 GPU/드라이버가 없으면 실패하므로
+      1프레임 테스트 인코딩까지 성공한 것만 사용
+    """
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+        ).stdout
+    except FileNotFoundError:
+        return "libx264"
+
+    for encoder in ("h264_nvenc", "h264_videotoolbox", "h264_qsv"):
+        if f" {encoder} " not in listed:
+            continue
+        probe = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", encoder, "-f", "null", "-",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if probe.returncode == 0:
+            print(f"🚀 하드웨어 인코더 사용: {encoder}")
+            return encoder
+
+    return "libx264"
+
+
+def h264_encoder_args() -> List[str]:
+    """빠른 재인코딩용 -c:v + 인코더별 옵션 (하드웨어 인코더 우선)"""
+    encoder = _pick_h264_encoder()
+    return ["-c:v", encoder, *_H264_ENCODER_ARGS[encoder]]
+
+
+def default_h264_encoder_args() -> List[str]:
+    """encoder_args 를 안 넘겼을 때 쓸 -c:v 옵션 (FFMPEG_FAST_ENCODE=1 일 때만 빠른 인코더)"""
+    if FFMPEG_FAST_ENCODE:
+        return h264_encoder_args()
+    return list(LIBX264_ENCODER_ARGS)
+
+
+def run_ffmpeg(cmd: List[str], timeout: float = FFMPEG_TIMEOUT_S) -> str:
+    """
+    ffmpeg 실행 헬퍼.
+    - FFMPEG_LOG_ARGS 를 붙여 에러 메시지만 stderr 로 받는다 (성공 시 보통 비어 있음)
+    - stdin 은 DEVNULL, 별도 세션으로 띄우고 timeout 초과 시 프로세스를 죽인 뒤 FFmpegTimeoutError
+    - 하드웨어 인코더는 동시 세션 수가 제한되므로 (소비자용 NVENC 3~5개) 슬롯을 잡고 실행
+    - 실패 시 stderr 가 담긴 CalledProcessError 를 그대로 올린다
+    - 반환: stderr (경고 로그)
+    """
+    uses_hw_encoder = any(arg in _HW_H264_ENCODERS for arg in cmd)
+    if uses_hw_encoder:
+        _HW_ENCODE_SLOTS.acquire()
+    try:
+        completed = subprocess.run(
+            [cmd[0], *FFMPEG_LOG_ARGS, *cmd[1:]],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            timeout=timeout,
+            start_new_session=True,
+        )
+    except subprocess.TimeoutExpired as e:
+        # subprocess.run 이 이미 프로세스를 kill 한 상태
+        raise FFmpegTimeoutError(f"ffmpeg가 {timeout}초 안에 끝나지 않았습니다: {' '.join(cmd)}") from e
+    finally:
+        if uses_hw_encoder:
+            _HW_ENCODE_SLOTS.release()
+    return completed.stderr
+
+
+# drawtext 경로용 escape 테이블 (한 번만 만들어 두고 str.translate로 한 번에 치환)
+_DRAWTEXT_PATH_ESCAPE = str.maketrans({"\\": "\\\\", ":": "\\:"})
+
+
+def ffmpeg_escape_font_path(path: str) -> str:
+    """
+    drawtext fontfile/textfile용 경로 escape:
+    - 백슬래시 → \\
+    - 콜론 → \:
+    """
+    return path.translate(_DRAWTEXT_PATH_ESCAPE)
+
+
+# --------------------------------------------------
+# probe (해상도 / 코덱 파라미터)
+# --------------------------------------------------
+
+def _file_key(input_video: str) -> Tuple[int, int]:
+    """probe 캐시 무효화용 (mtime_ns, size). 파일이 없으면 (0, 0)"""
+    try:
+        st = os.stat(input_video)
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+def get_video_resolution(input_video: str, fallback=(1920, 1080)) -> tuple[int, int]:
+    """
+    (width, height) 가져오되, 실패하면 fallback 해상도(기본 1920x1080)를 리턴.
+    같은 파일(경로+mtime+크기)은 한 번만 probe 한다.
+    """
+    resolution = _probe_resolution_cached(input_video, *_file_key(input_video))
+    if resolution is None:
+        print("⚠️ ffprobe 실패, fallback 해상도 사용:", fallback)
+        return fallback
+    return resolution
+
+
+@lru_cache(maxsize=32)
+def _probe_resolution_cached(input_video: str, mtime_ns: int, size: int) -> Optional[tuple[int, int]]:
+    """get_video_resolution 의 실제 probe (mtime_ns/size 는 캐시 무효화용 키)"""
+    if av is not None:
+        try:
+            with av.open(input_video) as container:
+                stream = container.streams.video[0]
+                return stream.codec_context.width, stream.codec_context.height
+        except (av.error.FFmpegError, IndexError, OSError) as e:
+            print("PyAV probe 실패:", e)
+            return None
+
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "csv=s=x:p=0",  # "1920x1080" 한 줄로 출력
+        input_video,
+    ]
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            timeout=FFPROBE_TIMEOUT_S,
+            start_new_session=True,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"⚠️ ffprobe {FFPROBE_TIMEOUT_S}초 초과:", input_video)
+        return None
+
+    if proc.returncode != 0:
+        print("ffprobe stderr:")
+        print(proc.stderr)
+        return None
+
+    try:
+        w, h = map(int, proc.stdout.strip().split("x"))
+    except ValueError:
+        print("ffprobe 출력 파싱 실패:", proc.stdout)
+        return None
+    return w, h
+
+
+# 이 값들이 모두 같으면 concat demuxer + -c copy 로 재인코딩 없이 이어붙일 수 있다
+_CONCAT_COPY_KEYS = (
+    "codec", "profile", "pix_fmt", "width", "height", "fps", "time_base",
+    "audio_codec", "sample_rate", "channels",
+)
+
+# ffprobe profile 이름 → libx264 -profile:v 값
+_X264_PROFILES = {
+    "Baseline": "baseline",
+    "Constrained Baseline": "baseline",
+    "Main": "main",
+    "High": "high",
+}
+
+
+def probe_video_params(input_video: str) -> Optional[Dict[str, Any]]:
+    """
+    인트로를 본편과 똑같이 인코딩하는 데 필요한 값
+    (코덱/프로파일/레벨/pix_fmt/해상도/fps/timebase/오디오)을 읽는다. 실패하면 None.
+    - PyAV 가 있으면 in-process 로, 없으면 ffprobe 로 읽는다
+    - 같은 파일(경로+mtime+크기)은 한 번만 probe 한다
+    """
+    params = _probe_video_params_cached(input_video, *_file_key(input_video))
+    return dict(params) if params else None
+
+
+@lru_cache(maxsize=32)
+def _probe_video_params_cached(input_video: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """probe_video_params 의 실제 probe (mtime_ns/size 는 캐시 무효화용 키)"""
+    if av is not None:
+        return _probe_video_params_av(input_video)
+
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,profile,level,pix_fmt,width,height,"
+        "r_frame_rate,time_base,sample_rate,channels",
+        "-of", "json",
+        input_video,
+    ]
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            timeout=FFPROBE_TIMEOUT_S,
+            start_new_session=True,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"⚠️ ffprobe {FFPROBE_TIMEOUT_S}초 초과:", input_video)
+        return None
+
+    if proc.returncode != 0:
+        print("⚠️ ffprobe 실패:", input_video)
+        print("ffprobe stderr:")
+        print(proc.stderr)
+        return None
+
+    streams = json.loads(proc.stdout).get("streams", [])
+    video = next((st for st in streams if st.get("codec_type") == "video"), None)
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+    if video is None:
+        return None
+
+    return {
+        "codec": video.get("codec_name"),
+        "profile": video.get("profile"),
+        "level": video.get("level"),
+        "pix_fmt": video.get("pix_fmt"),
+        "width": int(video["width"]),
+        "height": int(video["height"]),
+        "fps": video.get("r_frame_rate"),
+        "time_base": video.get("time_base"),
+        "audio_codec": audio.get("codec_name") if audio else None,
+        "sample_rate": audio.get("sample_rate") if audio else None,
+        "channels": audio.get("channels") if audio else None,
+    }
+
+
+def _fraction_str(value: Any) -> Optional[str]:
+    """Fraction → ffprobe 와 같은 'num/den' 문자열"""
+    if value is None:
+        return None
+    return f"{value.numerator}/{value.denominator}"
+
+
+def _probe_video_params_av(input_video: str) -> Optional[Dict[str, Any]]:
+    """probe_video_params 의 PyAV 버전 (ffprobe 와 같은 키/값 형식으로 반환)"""
+    try:
+        with av.open(input_video) as container:
+            if not container.streams.video:
+                return None
+            video = container.streams.video[0]
+            audio = container.streams.audio[0] if container.streams.audio else None
+            vctx = video.codec_context
+            actx = audio.codec_context if audio else None
+
+            return {
+                "codec": vctx.name,
+                "profile": video.profile,
+                "level": getattr(vctx, "level", None),
+                "pix_fmt": vctx.pix_fmt,
+                "width": int(vctx.width),
+                "height": int(vctx.height),
+                "fps": _fraction_str(video.base_rate),
+                "time_base": _fraction_str(video.time_base),
+                "audio_codec": actx.name if actx else None,
+                "sample_rate": str(actx.sample_rate) if actx else None,
+                "channels": len(actx.layout.channels) if actx else None,
+            }
+    except (av.error.FFmpegError, OSError) as e:
+        print("⚠️ PyAV probe 실패:", input_video, e)
+        return None
+
+
+def can_stream_copy_concat(a: Optional[Dict[str, Any]], b: Optional[Dict[str, Any]]) -> bool:
+    """두 영상의 코덱 파라미터가 같아서 -c copy 로 이어붙일 수 있는지"""
+    if not a or not b:
+        return False
+    return all(a.get(k) == b.get(k) for k in _CONCAT_COPY_KEYS)
+
+
+# --------------------------------------------------
+# 인트로 (검정 배경 + 축제명/기간) / concat
+# --------------------------------------------------
+
+# drawtext textfile= 로 넘길 자막 파일 위치
+INTRO_TEXT_DIR = Path("generated_videos") / ".intro_text"
+# concat demuxer 목록 파일 위치 (출력이 공개 폴더여도 목록 파일은 작업 폴더에 둔다)
+CONCAT_LIST_DIR = Path("generated_videos")
+
+
+def _write_intro_textfiles(
+    stem: str,
+    festival_name_ko: str,
+    festival_period_ko: str,
+) -> Tuple[Path, Path]:
+    """
+    축제명/기간을 escape 없이 UTF-8 파일로 써서 반환 (호출 측에서 삭제).
+    자막 내용은 textfile= 로 넘기므로 ' : \ 등이 들어 있어도 필터가 깨지지 않는다.
+    """
+    INTRO_TEXT_DIR.mkdir(parents=True, exist_ok=True)
+    title_file = (INTRO_TEXT_DIR / f"{stem}_title.txt").resolve()
+    period_file = (INTRO_TEXT_DIR / f"{stem}_period.txt").resolve()
+    title_file.write_text(festival_name_ko, encoding="utf-8")
+    period_file.write_text(festival_period_ko, encoding="utf-8")
+    return title_file, period_file
+
+
+def _build_intro_drawtext(
+    font_path: str,
+    title_file: Path,
+    period_file: Path,
+    fontsize_title: int = 56,
+    fontsize_period: int = 40,
+) -> str:
+    """축제명/기간 2줄 drawtext 필터 체인 (escape 는 파일 경로에만 적용)"""
+    fontfile = ffmpeg_escape_font_path(font_path)
+    title_textfile = ffmpeg_escape_font_path(str(title_file))
+    period_textfile = ffmpeg_escape_font_path(str(period_file))
+
+    return (
+        "drawtext="
+        f"fontfile='{fontfile}':"
+        f"textfile='{title_textfile}':"
+        f"fontsize={fontsize_title}:"
+        "fontcolor=white:"
+        "box=1:boxcolor=black@0.5:boxborderw=20:"
+        "x=(w-text_w)/2:"
+        "y=(h/2)-50"
+        ","
+        "drawtext="
+        f"fontfile='{fontfile}':"
+        f"textfile='{period_textfile}':"
+        f"fontsize={fontsize_period}:"
+        "fontcolor=white:"
+        "box=1:boxcolor=black@0.5:boxborderw=16:"
+        "x=(w-text_w)/2:"
+        "y=(h/2)+30"
+    )
+
+
+def create_black_intro_with_text(
+    output_video: str,
+    width: int,
+    height: int,
+    festival_name_ko: str,
+    festival_period_ko: str,
+    font_path: str,
+    duration: float = 2.0,
+    fps: int = 30,
+    fontsize_title: int = 56,
+    fontsize_period: int = 40,
+    match_params: Optional[Dict[str, Any]] = None,
+    encoder_args: Optional[List[str]] = None,
+) -> Path:
+    """
+    검정 배경 위에 축제명/기간 자막 2줄만 있는 인트로 영상 생성.
+    - match_params(probe_video_params 결과)를 주면 본편과 같은
+      프로파일/레벨/fps/timebase + 무음 오디오로 libx264 인코딩해서
+      concat_stream_copy 로 재인코딩 없이 이어붙일 수 있게 한다.
+    - encoder_args: match_params 가 없을 때 쓸 -c:v 옵션 (기본 default_h264_encoder_args())
+    """
+    out_path = Path(output_video)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    title_file, period_file = _write_intro_textfiles(
+        out_path.stem, festival_name_ko, festival_period_ko
+    )
+    drawtext = _build_intro_drawtext(
+        font_path, title_file, period_file, fontsize_title, fontsize_period
+    )
+
+    audio_input: List[str] = []
+    codec_args: List[str] = []
+    if match_params:
+        fps = match_params.get("fps") or fps
+
+        profile = _X264_PROFILES.get(match_params.get("profile") or "")
+        if profile:
+            codec_args += ["-profile:v", profile]
+        level = match_params.get("level") or 0
+        if level > 0:
+            codec_args += ["-level", f"{level / 10:.1f}"]
+        time_base = match_params.get("time_base") or ""
+        if "/" in time_base:
+            codec_args += ["-video_track_timescale", time_base.split("/")[1]]
+
+        # 본편에 AAC 오디오가 있으면 같은 샘플레이트/채널의 무음 트랙을 넣는다
+        if match_params.get("audio_codec") == "aac":
+            layout = "mono" if match_params.get("channels") == 1 else "stereo"
+            audio_input = [
+                "-f", "lavfi",
+                "-i", f"anullsrc=r={match_params.get('sample_rate')}:cl={layout}",
+            ]
+            codec_args += ["-map", "0:v", "-map", "1:a", "-c:a", "aac", "-shortest"]
+
+        # stream copy 용 인트로는 본편(libx264 계열 SPS)과 맞춰야 하므로 libx264 고정
+        video_codec_args = ["-c:v", "libx264"]
+    else:
+        video_codec_args = encoder_args or default_h264_encoder_args()
+
+    cmd = [
+        "ffmpeg",
+        "-f", "lavfi",
+        "-i", f"color=c=black:s={width}x{height}:d={duration}:r={fps}",
+        *audio_input,
+        "-vf", drawtext,
+        *video_codec_args,
+        "-pix_fmt", "yuv420p",
+        *codec_args,
+        "-y",
+        str(out_path),
+    ]
+
+    print("▶ ffmpeg (intro):")
+    print(" ".join(cmd))
+    print("  raw font_path =", font_path)
+
+    try:
+        run_ffmpeg(cmd, timeout=FFMPEG_INTRO_TIMEOUT_S)
+    except subprocess.CalledProcessError as e:
+        print("❌ ffmpeg intro 생성 실패")
+        print("stderr:")
+        print(e.stderr)
+        raise
+    finally:
+        title_file.unlink(missing_ok=True)
+        period_file.unlink(missing_ok=True)
+
+    return out_path
+
+
+def concat_stream_copy(input_paths: List[Path], out_path: Path) -> Path:
+    """concat demuxer + -c copy 로 재인코딩 없이 이어붙인다 (remux 만)."""
+    CONCAT_LIST_DIR.mkdir(parents=True, exist_ok=True)
+    list_file_path = CONCAT_LIST_DIR / f"{out_path.stem}_concat_list.txt"
+    list_file_path.write_text(
+        "".join(
+            "file '{}'\n".format(str(p.resolve()).replace("'", "'\\''"))
+            for p in input_paths
+        ),
+        encoding="utf-8",
+    )
+
+    cmd = [
+        "ffmpeg",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(list_file_path),
+        "-c", "copy",
+        "-movflags", "+faststart",
+        "-y",
+        str(out_path),
+    ]
+
+    print("▶ ffmpeg (concat intro+main, stream copy):")
+    print(" ".join(cmd))
+
+    try:
+        run_ffmpeg(cmd)
+    except subprocess.CalledProcessError as e:
+        print("❌ ffmpeg concat(stream copy) 실패")
+        print("stderr:")
+        print(e.stderr)
+        raise
+    finally:
+        list_file_path.unlink(missing_ok=True)
+
+    return out_path
+
+
+def concat_intro_and_main(
+    intro_video: str,
+    main_video: str,
+    output_video: str,
+    stream_copy: bool = True,
+    encoder_args: Optional[List[str]] = None,
+) -> Path:
+    """
+    인트로 영상 + 본편 영상 을 하나로 이어붙이기.
+    - stream_copy=True 이고 두 영상의 코덱 파라미터가 같으면 concat demuxer + -c copy (재인코딩 없음)
+    - 아니면 filter_complex concat 으로 비디오 재인코딩,
+      오디오는 본편(두 번째 입력) 것을 그대로 사용
+    - encoder_args: 재인코딩 시 -c:v 옵션 (기본 default_h264_encoder_args())
+    """
+    intro_path = Path(intro_video)
+    main_path = Path(main_video)
+    out_path = Path(output_video)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not intro_path.exists():
+        raise FileNotFoundError(f"intro 없음: {intro_path}")
+    if not main_path.exists():
+        raise FileNotFoundError(f"main 없음: {main_path}")
+
+    if stream_copy and can_stream_copy_concat(
+        probe_video_params(str(intro_path)),
+        probe_video_params(str(main_path)),
+    ):
+        return concat_stream_copy([intro_path, main_path], out_path)
+
+    cmd = [
+        "ffmpeg",
+        "-i", str(intro_path),
+        "-i", str(main_path),
+        "-filter_complex", "[0:v][1:v]concat=n=2:v=1:a=0[v]",
+        "-map", "[v]",
+        "-map", "1:a?",   # 본편에 오디오 있으면 복사, 없으면 무시
+        *(encoder_args or default_h264_encoder_args()),
+        "-c:a", "copy",
+        "-pix_fmt", "yuv420p",
+        "-y",
+        str(out_path),
+    ]
+
+    print("▶ ffmpeg (concat intro+main):")
+    print(" ".join(cmd))
+
+    try:
+        run_ffmpeg(cmd)
+    except subprocess.CalledProcessError as e:
+        print("❌ ffmpeg concat 실패")
+        print("stderr:")
+        print(e.stderr)
+        raise
+
+    return out_path
+
+
+def render_intro_and_concat(
+    main_video: str,
+    output_video: str,
+    width: int,
+    height: int,
+    festival_name_ko: str,
+    festival_period_ko: str,
+    font_path: str,
+    duration: float = 2.0,
+    fps: Any = 30,
+    encoder_args: Optional[List[str]] = None,
+) -> Path:
+    """
+    인트로(검정 배경 + 축제명/기간) 생성과 본편 concat 을 ffmpeg 한 번으로 처리.
+    - 인트로를 mp4 로 따로 인코딩/디코딩하지 않고 filter_complex 안에서 바로 이어붙임
+    - 미리 만든 인트로를 stream copy 로 붙일 수 없을 때 사용
+    - 오디오는 본편(두 번째 입력) 것을 그대로 사용
+    - encoder_args: -c:v 옵션 (기본 default_h264_encoder_args())
+    """
+    main_path = Path(main_video)
+    out_path = Path(output_video)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not main_path.exists():
+        raise FileNotFoundError(f"main 없음: {main_path}")
+
+    title_file, period_file = _write_intro_textfiles(
+        out_path.stem, festival_name_ko, festival_period_ko
+    )
+    drawtext = _build_intro_drawtext(font_path, title_file, period_file)
+
+    cmd = [
+        "ffmpeg",
+        "-f", "lavfi",
+        "-i", f"color=c=black:s={width}x{height}:d={duration}:r={fps}",
+        "-i", str(main_path),
+        "-filter_complex",
+        f"[0:v]{drawtext},setsar=1[intro];"
+        "[1:v]setsar=1[main];"
+        "[intro][main]concat=n=2:v=1:a=0[v]",
+        "-map", "[v]",
+        "-map", "1:a?",   # 본편에 오디오 있으면 복사, 없으면 무시
+        *(encoder_args or default_h264_encoder_args()),
+        "-pix_fmt", "yuv420p",
+        "-c:a", "copy",
+        "-y",
+        str(out_path),
+    ]
+
+    print("▶ ffmpeg (intro+main 단일 패스):")
+    print(" ".join(cmd))
+
+    try:
+        stderr = run_ffmpeg(cmd)
+        if stderr:
+            print("ffmpeg intro+concat stderr (경고/로그):")
+            print(stderr)
+    except subprocess.CalledProcessError as e:
+        print("❌ ffmpeg intro+concat 실패")
+        print("stderr:")
+        print(e.stderr)
+        raise
+    finally:
+        title_file.unlink(missing_ok=True)
+        period_file.unlink(missing_ok=True)
+
+    return out_path
@@ -2,71 +2,85 @@
 
 import os
 import time
+import asyncio
 import base64
 import json
 import io
-import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Dict, Final, Optional, Tuple, List
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 from openai import OpenAI
 from PIL import Image
 import subprocess
-from typing import Dict, List, Optional
 
-load_dotenv()
-
-# --------------------------------------------------
-# 공통 설정
-# --------------------------------------------------
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-...
-FRONT_PROJECT_ROOT = os.getenv("FRONT_PROJECT_ROOT")
-...
-PROMOTION_CODE = "M000001"  # 고정값
+from app.service.video.ffmpeg_utils import (
+    FFmpegTimeoutError,
+    concat_intro_and_main,
+    create_black_intro_with_text,
+    get_video_resolution,
+    run_ffmpeg,
+)
 
 load_dotenv()
 
 # --------------------------------------------------
-# 공통 설정
+# 공통 설정 (import 시 한 번만 읽어서 고정)
 # --------------------------------------------------
+PROMOTION_CODE: Final = "M000001"  # 고정값
 
-PROJECT_ROOT = os.getenv("PROJECT_ROOT")
-if not PROJECT_ROOT:
+_project_root_env = os.getenv("PROJECT_ROOT")
+if not _project_root_env:
     raise ValueError("PROJECT_ROOT 가 .env에 설정되어 있지 않습니다.")
-PROJECT_ROOT = Path(PROJECT_ROOT).resolve()
+PROJECT_ROOT: Final = Path(_project_root_env).resolve()
 
 # 인트로 자막용 한글 폰트 (예: app/fonts/Jalnan2TTF.ttf)
-INTRO_FONT_PATH = PROJECT_ROOT / "app" / "fonts" / "Jalnan2TTF.ttf"
+INTRO_FONT_PATH: Final = PROJECT_ROOT / "app" / "fonts" / "Jalnan2TTF.ttf"
 if not INTRO_FONT_PATH.exists():
     raise FileNotFoundError(f"인트로 자막용 폰트 파일을 찾을 수 없습니다: {INTRO_FONT_PATH}")
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_API_KEY: Final = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY 가 .env에 설정되어 있지 않습니다.")
 
-FRONT_PROJECT_ROOT = os.getenv("FRONT_PROJECT_ROOT")
+FRONT_PROJECT_ROOT: Final = os.getenv("FRONT_PROJECT_ROOT")
 if not FRONT_PROJECT_ROOT:
     raise ValueError("FRONT_PROJECT_ROOT 가 .env에 설정되어 있지 않습니다.")
+_FRONT_PUBLIC_ROOT: Final = Path(FRONT_PROJECT_ROOT) / "public"
 
 
 veo_client = genai.Client(api_key=GEMINI_API_KEY)
 openai_client = OpenAI()
 VEO_MODEL = "veo-3.1-generate-preview"
+# Veo 작업 하나를 기다리는 최대 시간 (초)
+VEO_OP_DEADLINE_S: Final = float(os.getenv("VEO_OP_DEADLINE_S", "900"))
+# Veo 기본 출력 해상도 (인트로를 본편보다 먼저 만들 때 가정하는 값)
+VEO_DEFAULT_RESOLUTION: Final = (1280, 720)
 
 
 # --------------------------------------------------
 # Veo 헬퍼 (기존 로직 그대로 유지)
 # --------------------------------------------------
 def wait_for_operation(operation):
-    """비동기 작업이 완료될 때까지 기다리는 헬퍼 함수"""
+    """
+    비동기 작업이 완료될 때까지 기다리는 헬퍼 함수.
+    - 10초 간격 polling
+    - VEO_OP_DEADLINE_S 를 넘기면 실패(None) 처리
+    """
+    deadline = time.monotonic() + VEO_OP_DEADLINE_S
+
     while not operation.done:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"❌ 비디오 생성 시간 초과 ({VEO_OP_DEADLINE_S:.0f}초)")
+            return None
+
         print("⏳ 비디오 생성 대기 중... (10초 후 재확인)")
-        time.sleep(10)
+        time.sleep(min(10.0, remaining))
         operation = veo_client.operations.get(operation)
 
     if operation.error:
@@ -79,9 +93,10 @@ def wait_for_operation(operation):
         return video_result
 
 
-def download_video(video_file, output_filename: str) -> Optional[Path]:
+async def download_video(video_file, output_filename: str) -> Optional[Path]:
     """
-    requests 라이브러리를 사용하여 비디오 URI에서 직접 다운로드합니다.
+    aiohttp를 사용하여 비디오 URI에서 직접 다운로드합니다.
+    (비동기로 동작하므로 다음 Veo 호출과 겹쳐서 실행할 수 있음)
     """
     DOWNLOAD_DIR = Path("generated_videos")
     DOWNLOAD_DIR.mkdir(exist_ok=True)
@@ -92,28 +107,28 @@ def download_video(video_file, output_filename: str) -> Optional[Path]:
     download_url = f"{video_uri}&key={GEMINI_API_KEY}" if "key=" not in video_uri else video_uri
 
     try:
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
+        async with aiohttp.ClientSession() as session:
+            async with session.get(download_url) as response:
+                response.raise_for_status()
 
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+                with open(output_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        f.write(chunk)
 
         print(f"⬇️ 비디오 다운로드 완료: {output_path.resolve()}")
         return output_path
     except Exception as e:
-        print(f"❌ 비디오 다운로드 실패 (requests 오류): {e}")
+        print(f"❌ 비디오 다운로드 실패 (aiohttp 오류): {e}")
         return None
 
 
-
 def generate_text_to_video(
     prompt: str,
     end_image_path: str = None,
-    download_name: str = "text_to_video.mp4",
-) -> Tuple[Optional[Any], Optional[Path]]:
+) -> Optional[Any]:
     """
-    Veo 3.1을 사용하여 이미지 기반 비디오를 생성하고 다운로드합니다.
+    Veo 3.1을 사용하여 텍스트 기반 비디오를 생성합니다.
+    (다운로드는 호출 측에서 download_video로 별도 진행)
     """
     print(f"\n--- 1. text to Video 시작 (프롬프트: {prompt[:60]}...) ---")
 
@@ -127,27 +142,21 @@ def generate_text_to_video(
         config=video_config,
     )
 
-    result_video = wait_for_operation(operation)
-
-    download_path = None
-    if result_video:
-        download_path = download_video(result_video, download_name)
-
-    return result_video, download_path
+    return wait_for_operation(operation)
 
 
 def extend_video(
     existing_video,
     extension_prompt: str,
     duration_s: int = 8,
-    download_name: str = "extended_video.mp4",
-) -> Tuple[Optional[Any], Optional[Path]]:
+) -> Optional[Any]:
     """
-    기존 Veo 비디오를 확장하여 새로운 클립을 생성하고 다운로드합니다.
+    기존 Veo 비디오를 확장하여 새로운 클립을 생성합니다.
+    (다운로드는 호출 측에서 download_video로 별도 진행)
     """
     if not existing_video:
         print("❌ 확장할 기존 비디오가 없습니다. 이전 단계의 비디오 객체가 필요합니다.")
-        return None, None
+        return None
 
     print(f"\n--- 3. Extension (비디오 확장) 시작, 길이: {duration_s}s ---")
     video_uri = existing_video.video.uri
@@ -163,13 +172,96 @@ def extend_video(
         config=video_config,
     )
 
-    result_video = wait_for_operation(operation)
+    return wait_for_operation(operation)
+
+
+async def _generate_veo_segments(
+    segment_1: str,
+    segment_2: str,
+    pNo: str,
+) -> Tuple[Optional[Path], Optional[Path]]:
+    """
+    segment_1 생성 → (segment_1 다운로드 ∥ segment_2 확장) → segment_2 다운로드.
+
+    확장 호출은 video 객체만 있으면 되므로, segment_1 다운로드를
+    백그라운드 태스크로 돌리고 곧바로 확장을 시작한다.
+    """
+    video_1 = await asyncio.to_thread(generate_text_to_video, prompt=segment_1)
+    if not video_1:
+        return None, None
+
+    dl1_task = asyncio.create_task(
+        download_video(video_1, f"segment_1_etc_prompt_{pNo}_8s.mp4")
+    )
+
+    video_2 = await asyncio.to_thread(
+        extend_video,
+        existing_video=video_1,
+        extension_prompt=segment_2,
+        duration_s=7,
+    )
+
+    path_2 = None
+    if video_2:
+        path_2 = await download_video(video_2, f"segment_2_etc_prompt_{pNo}_7s.mp4")
+
+    path_1 = await dl1_task
+    return path_1, path_2
+
+
+def _create_etc_intro(
+    pNo: str,
+    width: int,
+    height: int,
+    festival_name_ko: str,
+    festival_period_ko: str,
+) -> Path:
+    """generated_videos 하위에 2초 인트로(검정 배경 + 축제명/기간)를 만든다."""
+    DOWNLOAD_DIR = Path("generated_videos")
+    DOWNLOAD_DIR.mkdir(exist_ok=True)
+
+    return create_black_intro_with_text(
+        output_video=str(DOWNLOAD_DIR / f"etc_intro_{pNo}_2s.mp4"),
+        width=width,
+        height=height,
+        festival_name_ko=festival_name_ko,
+        festival_period_ko=festival_period_ko,
+        font_path=str(INTRO_FONT_PATH),
+        duration=2.0,
+        fps=30,
+        # 2초짜리 정지 화면 + 자막이라 빠른 preset으로 충분
+        encoder_args=[
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-tune", "stillimage",
+            "-g", "30",
+            "-crf", "23",
+        ],
+    )
 
-    download_path = None
-    if result_video:
-        download_path = download_video(result_video, download_name)
 
-    return result_video, download_path
+async def _generate_segments_and_intro(
+    segment_1: str,
+    segment_2: str,
+    pNo: str,
+    festival_name_ko: str,
+    festival_period_ko: str,
+) -> Tuple[Optional[Path], Optional[Path], Path]:
+    """
+    인트로는 축제명/기간과 해상도에만 의존하므로,
+    Veo 기본 해상도로 가정하고 segment 생성과 동시에 인코딩해 둔다.
+    """
+    intro_path, (path_1, path_2) = await asyncio.gather(
+        asyncio.to_thread(
+            _create_etc_intro,
+            pNo,
+            *VEO_DEFAULT_RESOLUTION,
+            festival_name_ko,
+            festival_period_ko,
+        ),
+        _generate_veo_segments(segment_1, segment_2, pNo),
+    )
+    return path_1, path_2, intro_path
 
 
 def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optional[Path]:
@@ -185,10 +277,19 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
     DOWNLOAD_DIR = Path("generated_videos")
     output_path = DOWNLOAD_DIR / output_filename
 
-    list_file_path = DOWNLOAD_DIR / "file_list.txt"
-    with open(list_file_path, "w", encoding="utf-8") as f:
-        for path in input_paths:
-            f.write(f"file '{path.name}'\n")
+    # 실행마다 고유한 목록 파일을 한 번에 써서, 동시에 도는 다른 ffmpeg가
+    # 쓰다 만 목록을 읽는 일이 없도록 한다.
+    list_data = "".join(f"file '{path.name}'\n" for path in input_paths)
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding="utf-8",
+        dir=str(DOWNLOAD_DIR),
+        prefix="file_list_",
+        suffix=".txt",
+        delete=False,
+    ) as tmp:
+        tmp.write(list_data)
+    list_file_path = Path(tmp.name)
 
     ffmpeg_command = [
         "ffmpeg",
@@ -205,223 +306,24 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
     ]
 
     try:
-        subprocess.run(ffmpeg_command, check=True, capture_output=True, text=True)
+        run_ffmpeg(ffmpeg_command)
         print(f"✅ 비디오 연결 완료: {output_path.resolve()}")
-        os.remove(list_file_path)
         return output_path
     except FileNotFoundError:
         print("❌ 오류: 'ffmpeg' 명령을 찾을 수 없습니다. FFmpeg PATH 설정 확인 필요.")
     except subprocess.CalledProcessError as e:
         print(f"❌ FFmpeg 실행 오류: {e.stderr}")
+    except FFmpegTimeoutError as e:
+        print(f"❌ {e}")
     except Exception as e:
         print(f"❌ 연결 중 알 수 없는 오류 발생: {e}")
+    finally:
+        list_file_path.unlink(missing_ok=True)
 
-    if list_file_path.exists():
-        os.remove(list_file_path)
     return None
 
 
 
-# --------------------------------------------------
-# FFmpeg / 인트로 관련 헬퍼
-# --------------------------------------------------
-
-def ffmpeg_escape_text(s: str) -> str:
-    """
-    ffmpeg drawtext용 텍스트 escape 헬퍼.
-    - \, :, ' 정도만 처리
-    """
-    return (
-        s.replace("\\", "\\\\")  # 역슬래시 → \\
-         .replace(":", "\\:")    # 콜론 → \:
-         .replace("'", "\\'")    # 작은따옴표 → \'
-    )
-
-
-def ffmpeg_escape_font_path(path: str) -> str:
-    """
-    drawtext fontfile용 경로 escape:
-    - 백슬래시 → \\
-    - 콜론 → \:
-    """
-    p = path.replace("\\", "\\\\")
-    p = p.replace(":", "\\:")
-    return p
-
-
-def get_video_resolution(input_video: str, fallback=(1920, 1080)) -> tuple[int, int]:
-    """
-    ffprobe로 (width, height) 가져오되,
-    실패하면 fallback 해상도(기본 1920x1080)를 리턴.
-    """
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "json",
-        input_video,
-    ]
-    proc = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
-
-    if proc.returncode != 0:
-        print("⚠️ ffprobe 실패, fallback 해상도 사용:", fallback)
-        print("ffprobe stderr:")
-        print(proc.stderr)
-        return fallback
-
-    info = json.loads(proc.stdout)
-    stream = info["streams"][0]
-    return int(stream["width"]), int(stream["height"])
-
-
-def create_black_intro_with_text(
-    output_video: str,
-    width: int,
-    height: int,
-    festival_name_ko: str,
-    festival_period_ko: str,
-    font_path: str,
-    duration: float = 2.0,
-    fps: int = 30,
-    fontsize_title: int = 56,
-    fontsize_period: int = 40,
-) -> Path:
-    """
-    검정 배경 위에 축제명/기간 자막 2줄만 있는 인트로 영상 생성.
-    """
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # 텍스트 / 폰트 escape (add_intro_caption에서 쓰던 방식 재사용)
-    fontfile = ffmpeg_escape_font_path(font_path)
-    title_text = ffmpeg_escape_text(festival_name_ko)
-    period_text = ffmpeg_escape_text(festival_period_ko)
-
-    drawtext = (
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{title_text}':"
-        f"fontsize={fontsize_title}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=20:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)-50"
-        ","
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{period_text}':"
-        f"fontsize={fontsize_period}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=16:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)+30"
-    )
-
-    cmd = [
-        "ffmpeg",
-        "-f", "lavfi",
-        "-i", f"color=c=black:s={width}x{height}:d={duration}:r={fps}",
-        "-vf", drawtext,
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (intro):")
-    print(" ".join(cmd))
-    print("  raw font_path =", font_path)
-    print("  fontfile     =", fontfile)
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg intro stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg intro 생성 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
-
-def concat_intro_and_main(
-    intro_video: str,
-    main_video: str,
-    output_video: str,
-) -> Path:
-    """
-    인트로 영상(무음) + 본편 영상 을 하나로 이어붙이기.
-    - 비디오 2개 concat
-    - 오디오는 본편(두 번째 입력) 것을 그대로 사용
-    """
-    intro_path = Path(intro_video)
-    main_path = Path(main_video)
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if not intro_path.exists():
-        raise FileNotFoundError(f"intro 없음: {intro_path}")
-    if not main_path.exists():
-        raise FileNotFoundError(f"main 없음: {main_path}")
-
-    cmd = [
-        "ffmpeg",
-        "-i", str(intro_path),
-        "-i", str(main_path),
-        "-filter_complex", "[0:v][1:v]concat=n=2:v=1:a=0[v]",
-        "-map", "[v]",
-        "-map", "1:a?",   # 본편에 오디오 있으면 복사, 없으면 무시
-        "-c:v", "libx264",
-        "-c:a", "copy",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (concat intro+main):")
-    print(" ".join(cmd))
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg concat stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg concat 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
 # --------------------------------------------------
 # LLM: 포스터 기반 Veo 프롬프트 생성
 # --------------------------------------------------
@@ -590,8 +492,12 @@ def _encode_image_to_small_data_url(image_path: str, max_size: int = 256, qualit
     if not p.exists():
         raise FileNotFoundError(f"포스터 파일을 찾을 수 없음: {image_path}")
 
-    img = Image.open(p).convert("RGB")
-    img.thumbnail((max_size, max_size), Image.LANCZOS)
+    img = Image.open(p)
+    # JPEG이면 libjpeg가 1/2~1/8로 줄여서 디코딩 (PNG 등은 no-op)
+    img.draft("RGB", (max_size * 2, max_size * 2))
+    img = img.convert("RGB")
+    # 결과가 quality 60 JPEG이라 LANCZOS 품질 차이는 어차피 사라짐
+    img.thumbnail((max_size, max_size), Image.BILINEAR)
 
     buf = io.BytesIO()
     img.save(buf, format="JPEG", quality=quality, optimize=True)
@@ -702,26 +608,20 @@ def run_etc_video_to_editor(
 
     segment_paths: list[Path] = []
 
-    # 3. 첫 8초 이미지→비디오
-    video_1, path_1 = generate_text_to_video(
-        prompt=segment_1,
-        end_image_path=None,
-        download_name=f"segment_1_etc_prompt_{pNo}_8s.mp4",
-    )
-    if path_1:
-        segment_paths.append(path_1)
-
-    # 4. 확장 7초
-    video_2, path_2 = (None, None)
-    if video_1:
-        video_2, path_2 = extend_video(
-            existing_video=video_1,
-            extension_prompt=segment_2,
-            duration_s=7,
-            download_name=f"segment_2_etc_prompt_{pNo}_7s.mp4",
+    # 3. 첫 8초 텍스트→비디오 + 4. 확장 7초
+    #    (segment_1 다운로드는 확장 호출과, 인트로 인코딩은 Veo 생성과 겹쳐서 진행)
+    path_1, path_2, intro_video_path = asyncio.run(
+        _generate_segments_and_intro(
+            segment_1,
+            segment_2,
+            pNo,
+            festival_name_ko,
+            festival_period_ko,
         )
-        if path_2:
-            segment_paths.append(path_2)
+    )
+    for path in (path_1, path_2):
+        if path:
+            segment_paths.append(path)
 
         # NOTE:
     # - 예전에는 segment_1(8s) + segment_2(7s)를 우리가 FFmpeg로 이어붙였지만,
@@ -734,44 +634,43 @@ def run_etc_video_to_editor(
 
     main_video_path = path_2  # ← Veo 두 번째 결과를 최종 본편으로 사용
 
-    # 5. 인트로(검정 배경 + 축제명/기간) 2초 생성 → 본편과 concat
+    # 5. 인트로(검정 배경 + 축제명/기간) 2초 → 본편과 concat
 
     # 5-1) 본편 해상도 추출
     width, height = get_video_resolution(str(main_video_path))
     print(f"🎞 본편 해상도: {width} x {height}")
 
-    # 5-2) 인트로 영상 생성 (generated_videos 폴더 하위)
-    DOWNLOAD_DIR = Path("generated_videos")
-    DOWNLOAD_DIR.mkdir(exist_ok=True)
-
-    intro_output = DOWNLOAD_DIR / f"etc_intro_{pNo}_2s.mp4"
-    intro_video_path = create_black_intro_with_text(
-        output_video=str(intro_output),
-        width=width,
-        height=height,
-        festival_name_ko=festival_name_ko,
-        festival_period_ko=festival_period_ko,
-        font_path=str(INTRO_FONT_PATH),
-        duration=2.0,
-        fps=30,
-    )
-
-    # 5-3) 인트로 + 본편 concat (임시 최종본)
-    final_temp = concat_intro_and_main(
-        intro_video=str(intro_video_path),
-        main_video=str(main_video_path),
-        output_video=str(DOWNLOAD_DIR / f"etc_video_{pNo}_with_intro.mp4"),
-    )
+    # 5-2) 미리 만든 인트로가 가정한 해상도와 다르면 다시 생성 (드문 경우)
+    if (width, height) != VEO_DEFAULT_RESOLUTION:
+        print(f"⚠️ 본편 해상도가 기본값 {VEO_DEFAULT_RESOLUTION} 과 달라 인트로를 다시 생성합니다.")
+        intro_video_path = _create_etc_intro(
+            pNo,
+            width,
+            height,
+            festival_name_ko,
+            festival_period_ko,
+        )
 
-    # 6. FRONT public/data/promotion/M000001/{pNo}/video/poster_video.mp4 로 이동
-    front_root = Path(FRONT_PROJECT_ROOT)
-    public_root = front_root / "public"
+    # 5-3) 인트로 + 본편 concat → FRONT public/data/promotion/M000001/{pNo}/video/etc_video.mp4
+    #      같은 폴더의 임시 이름으로 쓴 뒤 os.replace 로 교체
+    #      (ffmpeg 가 실패/타임아웃으로 죽어도 잘린 파일이 공개 이름으로 남지 않음)
     rel_dir = Path("data") / "promotion" / PROMOTION_CODE / pNo / "video"
-    target_dir = public_root / rel_dir
+    target_dir = _FRONT_PUBLIC_ROOT / rel_dir
     target_dir.mkdir(parents=True, exist_ok=True)
 
     target_path = target_dir / "etc_video.mp4"
-    shutil.move(str(final_temp), target_path)
+    temp_path = target_dir / f"etc_video_{pNo}.tmp.mp4"
+    try:
+        concat_intro_and_main(
+            intro_video=str(intro_video_path),
+            main_video=str(main_video_path),
+            output_video=str(temp_path),
+            # 인트로는 본편 파라미터에 맞춰 만들지 않으므로 probe 없이 바로 재인코딩
+            stream_copy=False,
+        )
+        os.replace(temp_path, target_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
     print(f"✅ 최종 포스터 홍보 영상 저장: {target_path}")
 
     db_rel_path = (Path("data") / "promotion" / PROMOTION_CODE / pNo / "video" / "etc_video.mp4").as_posix()
@@ -2,39 +2,53 @@
 
 import os
 import time
+import random
 import base64
+import hashlib
+import importlib.util
 import json
 import io
+import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Callable, Dict, Optional, Tuple, List
 
-import requests
+import httpx
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 from openai import OpenAI
 from PIL import Image
 import subprocess
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+# 썸네일을 torchvision(GPU)으로 만들지 여부. torch import 가 무거워서 기본은 PIL draft 경로.
+THUMBNAIL_USE_TORCH = os.getenv("THUMBNAIL_USE_TORCH") == "1"
+
+# SIMD base64 (없으면 표준 base64 사용)
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+from app.service.video.ffmpeg_utils import (
+    can_stream_copy_concat,
+    concat_stream_copy,
+    create_black_intro_with_text,
+    probe_video_params,
+    render_intro_and_concat,
+    run_ffmpeg,
+)
 
 load_dotenv()
 
 # --------------------------------------------------
 # 공통 설정
 # --------------------------------------------------
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-...
-FRONT_PROJECT_ROOT = os.getenv("FRONT_PROJECT_ROOT")
-...
 PROMOTION_CODE = "M000001"  # 고정값
 
-load_dotenv()
-
-# --------------------------------------------------
-# 공통 설정
-# --------------------------------------------------
-
 PROJECT_ROOT = os.getenv("PROJECT_ROOT")
 if not PROJECT_ROOT:
     raise ValueError("PROJECT_ROOT 가 .env에 설정되어 있지 않습니다.")
@@ -55,20 +69,84 @@ if not FRONT_PROJECT_ROOT:
     raise ValueError("FRONT_PROJECT_ROOT 가 .env에 설정되어 있지 않습니다.")
 
 
-veo_client = genai.Client(api_key=GEMINI_API_KEY)
-openai_client = OpenAI()
+# API 클라이언트는 처음 쓸 때 만든다 (import 시간 단축)
+veo_client: Optional[genai.Client] = None
+openai_client: Optional[OpenAI] = None
+
+
+def _get_veo_client() -> genai.Client:
+    global veo_client
+    veo_client = veo_client or genai.Client(api_key=GEMINI_API_KEY)
+    return veo_client
+
+
+def _get_openai_client() -> OpenAI:
+    global openai_client
+    openai_client = openai_client or OpenAI()
+    return openai_client
+
+
 VEO_MODEL = "veo-3.1-generate-preview"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 다운로드 복사 버퍼 (1 MiB)
+
+# HTTP/2 는 h2 패키지가 있을 때만 켠다.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Veo 결과/마스코트 이미지 다운로드용 공유 클라이언트 (keep-alive 연결 재사용, 처음 쓸 때 생성)
+http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    global http_client
+    http_client = http_client or httpx.Client(
+        http2=_HTTP2_AVAILABLE,
+        follow_redirects=True,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+    return http_client
+
+# Veo 3.1 확장 결과(본편) 기본 출력 해상도 (확장은 720p만 지원)
+VEO_DEFAULT_RES = (1280, 720)
+
+# Veo 본편 코덱 파라미터 (추정값). 본편이 나오기 전에 인트로를 이 값에 맞춰 미리 만들어 두고,
+# 본편이 나오면 probe 해서 실제로 맞을 때만 stream copy concat 한다. (동시 실행이 공유하므로 읽기 전용)
+_VEO_OUTPUT_PARAMS = MappingProxyType({
+    "codec": "h264",
+    "profile": "High",
+    "level": None,
+    "pix_fmt": "yuv420p",
+    "width": VEO_DEFAULT_RES[0],
+    "height": VEO_DEFAULT_RES[1],
+    "fps": "24/1",
+    "time_base": "1/12288",
+    "audio_codec": "aac",
+    "sample_rate": "48000",
+    "channels": 2,
+})
 
 
 # --------------------------------------------------
 # Veo 헬퍼 (기존 로직 그대로 유지)
 # --------------------------------------------------
 def wait_for_operation(operation):
-    """비동기 작업이 완료될 때까지 기다리는 헬퍼 함수"""
+    """
+    비동기 작업이 완료될 때까지 기다리는 헬퍼 함수.
+    2초부터 1.5배씩 늘려 최대 15초 간격(+최대 0.5초 jitter)으로 재확인하고,
+    작업 상태(metadata)가 바뀌면 다시 짧은 간격부터 시작한다.
+    """
+    n = 0
+    last_status = operation.metadata
     while not operation.done:
-        print("⏳ 비디오 생성 대기 중... (10초 후 재확인)")
-        time.sleep(10)
-        operation = veo_client.operations.get(operation)
+        delay = min(15.0, 2.0 * 1.5 ** n) + random.uniform(0, 0.5)
+        print(f"⏳ 비디오 생성 대기 중... ({delay:.1f}초 후 재확인)")
+        time.sleep(delay)
+        n += 1
+        operation = _get_veo_client().operations.get(operation)
+
+        if operation.metadata != last_status:
+            last_status = operation.metadata
+            n = 0
 
     if operation.error:
         print(f"❌ 비디오 생성 실패: {operation.error}")
@@ -82,7 +160,7 @@ def wait_for_operation(operation):
 
 def download_video(video_file, output_filename: str) -> Optional[Path]:
     """
-    requests 라이브러리를 사용하여 비디오 URI에서 직접 다운로드합니다.
+    공유 httpx 클라이언트(_get_http_client)로 비디오 URI에서 직접 다운로드합니다.
     """
     DOWNLOAD_DIR = Path("generated_videos")
     DOWNLOAD_DIR.mkdir(exist_ok=True)
@@ -93,37 +171,46 @@ def download_video(video_file, output_filename: str) -> Optional[Path]:
     download_url = f"{video_uri}&key={GEMINI_API_KEY}" if "key=" not in video_uri else video_uri
 
     try:
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with _get_http_client().stream("GET", download_url) as response:
+            response.raise_for_status()
+            with open(output_path, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
         print(f"⬇️ 비디오 다운로드 완료: {output_path.resolve()}")
         return output_path
     except Exception as e:
-        print(f"❌ 비디오 다운로드 실패 (requests 오류): {e}")
+        print(f"❌ 비디오 다운로드 실패 (httpx 오류): {e}")
         return None
 
 
-def _read_and_encode_image(image_path: str) -> types.Image:
-    """로컬 이미지를 읽어 Base64로 인코딩하고 types.Image 객체로 반환합니다."""
+def _b64encode_str(data) -> str:
+    """bytes → base64 문자열 (pybase64 가 있으면 SIMD 경로)"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _read_and_encode_image(image_path: str, image_bytes: Optional[bytes] = None) -> types.Image:
+    """
+    로컬 이미지를 읽어 types.Image 객체로 반환합니다.
+    - image_bytes 에는 원본 bytes 를 그대로 넘긴다 (직렬화 시 SDK가 base64 처리)
+    - image_bytes 를 이미 읽어 두었으면 디스크를 다시 읽지 않는다 (mime 은 경로 확장자로 판단)
+    """
     image_path = Path(image_path)
-    if not image_path.exists():
+    if image_bytes is None and not image_path.exists():
         raise FileNotFoundError(f"이미지 파일이 존재하지 않습니다: {image_path}")
 
     mime_type = "image/jpeg"
     if image_path.suffix.lower() == ".png":
         mime_type = "image/png"
 
-    with open(image_path, "rb") as f:
-        image_bytes = f.read()
-
-    base64_encoded_data = base64.b64encode(image_bytes).decode("utf-8")
+    if image_bytes is None:
+        with open(image_path, "rb") as f:
+            image_bytes = f.read()
 
     return types.Image(
-        image_bytes=base64_encoded_data,
+        image_bytes=image_bytes,
         mime_type=mime_type,
     )
 
@@ -133,14 +220,16 @@ def generate_image_to_video(
     start_image_path: str,
     end_image_path: str = None,
     download_name: str = "image_to_video.mp4",
+    start_image_bytes: Optional[bytes] = None,
 ) -> Tuple[Optional[Any], Optional[Path]]:
     """
     Veo 3.1을 사용하여 이미지 기반 비디오를 생성하고 다운로드합니다.
+    - start_image_bytes: 시작 이미지를 이미 메모리에 읽어 두었으면 전달 (디스크 재읽기 생략)
     """
     print(f"\n--- 1. Image to Video 시작 (프롬프트: {prompt[:60]}...) ---")
 
     try:
-        start_frame_image = _read_and_encode_image(start_image_path)
+        start_frame_image = _read_and_encode_image(start_image_path, start_image_bytes)
         print(f"✅ 시작 이미지 Base64 인코딩 완료: {start_image_path}")
 
         last_frame_image = None
@@ -160,7 +249,7 @@ def generate_image_to_video(
 
     video_config = types.GenerateVideosConfig(**config_params) if config_params else None
 
-    operation = veo_client.models.generate_videos(
+    operation = _get_veo_client().models.generate_videos(
         model=VEO_MODEL,
         prompt=prompt,
         image=start_frame_image,
@@ -196,7 +285,7 @@ def extend_video(
 
     video_config = types.GenerateVideosConfig()
 
-    operation = veo_client.models.generate_videos(
+    operation = _get_veo_client().models.generate_videos(
         model=VEO_MODEL,
         prompt=extension_prompt,
         video=existing_video.video,
@@ -245,7 +334,7 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
     ]
 
     try:
-        subprocess.run(ffmpeg_command, check=True, capture_output=True, text=True)
+        run_ffmpeg(ffmpeg_command)
         print(f"✅ 비디오 연결 완료: {output_path.resolve()}")
         os.remove(list_file_path)
         return output_path
@@ -262,210 +351,13 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
 
 
 
-# --------------------------------------------------
-# FFmpeg / 인트로 관련 헬퍼
-# --------------------------------------------------
-
-def ffmpeg_escape_text(s: str) -> str:
-    """
-    ffmpeg drawtext용 텍스트 escape 헬퍼.
-    - \, :, ' 정도만 처리
-    """
-    return (
-        s.replace("\\", "\\\\")  # 역슬래시 → \\
-         .replace(":", "\\:")    # 콜론 → \:
-         .replace("'", "\\'")    # 작은따옴표 → \'
-    )
-
-
-def ffmpeg_escape_font_path(path: str) -> str:
-    """
-    drawtext fontfile용 경로 escape:
-    - 백슬래시 → \\
-    - 콜론 → \:
-    """
-    p = path.replace("\\", "\\\\")
-    p = p.replace(":", "\\:")
-    return p
-
-
-def get_video_resolution(input_video: str, fallback=(1920, 1080)) -> tuple[int, int]:
-    """
-    ffprobe로 (width, height) 가져오되,
-    실패하면 fallback 해상도(기본 1920x1080)를 리턴.
-    """
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "json",
-        input_video,
-    ]
-    proc = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
-
-    if proc.returncode != 0:
-        print("⚠️ ffprobe 실패, fallback 해상도 사용:", fallback)
-        print("ffprobe stderr:")
-        print(proc.stderr)
-        return fallback
-
-    info = json.loads(proc.stdout)
-    stream = info["streams"][0]
-    return int(stream["width"]), int(stream["height"])
-
-
-def create_black_intro_with_text(
-    output_video: str,
-    width: int,
-    height: int,
-    festival_name_ko: str,
-    festival_period_ko: str,
-    font_path: str,
-    duration: float = 2.0,
-    fps: int = 30,
-    fontsize_title: int = 56,
-    fontsize_period: int = 40,
-) -> Path:
-    """
-    검정 배경 위에 축제명/기간 자막 2줄만 있는 인트로 영상 생성.
-    """
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # 텍스트 / 폰트 escape (add_intro_caption에서 쓰던 방식 재사용)
-    fontfile = ffmpeg_escape_font_path(font_path)
-    title_text = ffmpeg_escape_text(festival_name_ko)
-    period_text = ffmpeg_escape_text(festival_period_ko)
-
-    drawtext = (
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{title_text}':"
-        f"fontsize={fontsize_title}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=20:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)-50"
-        ","
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{period_text}':"
-        f"fontsize={fontsize_period}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=16:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)+30"
-    )
-
-    cmd = [
-        "ffmpeg",
-        "-f", "lavfi",
-        "-i", f"color=c=black:s={width}x{height}:d={duration}:r={fps}",
-        "-vf", drawtext,
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (intro):")
-    print(" ".join(cmd))
-    print("  raw font_path =", font_path)
-    print("  fontfile     =", fontfile)
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg intro stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg intro 생성 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
-
-def concat_intro_and_main(
-    intro_video: str,
-    main_video: str,
-    output_video: str,
-) -> Path:
-    """
-    인트로 영상(무음) + 본편 영상 을 하나로 이어붙이기.
-    - 비디오 2개 concat
-    - 오디오는 본편(두 번째 입력) 것을 그대로 사용
-    """
-    intro_path = Path(intro_video)
-    main_path = Path(main_video)
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if not intro_path.exists():
-        raise FileNotFoundError(f"intro 없음: {intro_path}")
-    if not main_path.exists():
-        raise FileNotFoundError(f"main 없음: {main_path}")
-
-    cmd = [
-        "ffmpeg",
-        "-i", str(intro_path),
-        "-i", str(main_path),
-        "-filter_complex", "[0:v][1:v]concat=n=2:v=1:a=0[v]",
-        "-map", "[v]",
-        "-map", "1:a?",   # 본편에 오디오 있으면 복사, 없으면 무시
-        "-c:v", "libx264",
-        "-c:a", "copy",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (concat intro+main):")
-    print(" ".join(cmd))
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg concat stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg concat 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
 # --------------------------------------------------
 # LLM: 포스터 기반 Veo 프롬프트 생성
 # --------------------------------------------------
 
+# OpenAI 프롬프트 캐시 라우팅 키 (시스템 프롬프트를 바꾸면 버전도 올릴 것)
+MASCOT_PROMPT_CACHE_KEY = "mascot_v1"
+
 MASCOT_VIDEO_SYSTEM_PROMPT = """
 You are a professional festival MASCOT promo-video prompt designer for Google Veo 3.
 
@@ -627,25 +519,176 @@ You must return ONLY JSON of the following form:
 
 
 
-def _encode_image_to_small_data_url(image_path: str, max_size: int = 256, quality: int = 60) -> str:
+def _thumbnail_jpeg_torchvision(
+    p: Path,
+    max_size: int,
+    quality: int,
+    image_bytes: Optional[bytes] = None,
+) -> bytes:
+    """
+    torchvision으로 디코딩 → 축소 → JPEG 인코딩 (CUDA 있으면 GPU, 없으면 CPU).
+    PIL thumbnail 과 같이 비율 유지 + 축소만 한다.
+    - THUMBNAIL_USE_TORCH=1 일 때만 호출되며, torch 는 여기서 처음 import 한다
+    """
+    import torch
+    from torchvision.io import ImageReadMode, decode_image, decode_jpeg, encode_jpeg, read_file
+    from torchvision.transforms.v2 import functional as TF
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    if image_bytes is not None:
+        data = torch.frombuffer(bytearray(image_bytes), dtype=torch.uint8)
+    else:
+        data = read_file(str(p))
+
+    if p.suffix.lower() in (".jpg", ".jpeg"):
+        img = decode_jpeg(data, mode=ImageReadMode.RGB, device=device)
+    else:
+        img = decode_image(data, mode=ImageReadMode.RGB).to(device)
+
+    h, w = img.shape[-2:]
+    scale = max_size / max(h, w)
+    if scale < 1:
+        img = TF.resize(img, [max(1, round(h * scale)), max(1, round(w * scale))], antialias=True)
+
+    return encode_jpeg(img, quality=quality).cpu().numpy().tobytes()
+
+
+def _encode_image_to_small_data_url(
+    image_path: str,
+    max_size: int = 256,
+    quality: int = 60,
+    image_bytes: Optional[bytes] = None,
+) -> str:
     """
     포스터 이미지를 Vision용으로만 쓸 작은 썸네일로 줄여서
     data:image/jpeg;base64,... 형태로 변환 (TPM 방지용).
+    - image_bytes 를 주면 파일 대신 메모리의 원본 bytes 에서 디코딩
     """
     p = Path(image_path)
-    if not p.exists():
+    if image_bytes is None and not p.exists():
         raise FileNotFoundError(f"포스터 파일을 찾을 수 없음: {image_path}")
 
-    img = Image.open(p).convert("RGB")
-    img.thumbnail((max_size, max_size), Image.LANCZOS)
+    if THUMBNAIL_USE_TORCH:
+        jpeg_bytes = _thumbnail_jpeg_torchvision(p, max_size, quality, image_bytes)
+    else:
+        img = Image.open(io.BytesIO(image_bytes) if image_bytes is not None else p)
+        # JPEG이면 libjpeg DCT 스케일링으로 축소 디코딩 (PNG 등은 no-op)
+        img.draft("RGB", (max_size * 2, max_size * 2))
+        img = img.convert("RGB")
+        img.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=quality, optimize=True)
+        jpeg_bytes = buf.getbuffer()  # 복사 없는 memoryview
 
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=quality, optimize=True)
-    buf.seek(0)
-    b64 = base64.b64encode(buf.read()).decode("utf-8")
+    b64 = _b64encode_str(jpeg_bytes)
     return f"data:image/jpeg;base64,{b64}"
 
 
+@lru_cache(maxsize=64)
+def _build_programs_block(program_name: Tuple[str, ...]) -> str:
+    """프로그램 목록 → '- 이름' 줄 블록 (같은 목록 반복 호출 시 재사용)"""
+    return "\n".join(f"- {name}" for name in program_name)
+
+
+_SEGMENT_1_KEY_RE = re.compile(r'"segment_1_mascot_prompt"\s*:\s*')
+# 키가 delta 경계에 걸쳐 들어올 수 있으므로, 다시 검색할 때 이만큼 앞에서부터 본다
+_SEGMENT_1_KEY_LOOKBACK = 64
+
+
+class _Segment1Scanner:
+    """
+    스트리밍 중인 JSON 텍스트에서 segment_1_mascot_prompt 문자열 값이 닫히는 순간을 찾는다.
+    - 누적 버퍼 전체를 delta 마다 다시 훑지 않고, 지난번에 멈춘 위치부터 새로 들어온 부분만 검사
+    """
+
+    def __init__(self) -> None:
+        self.pos = 0  # 다음에 검사할 위치
+        self.value_start: Optional[int] = None  # 값의 여는 따옴표 위치
+        self.key_found = False
+        self.done = False
+
+    def feed(self, buf: str) -> Optional[str]:
+        """buf 에 segment_1 값이 완성됐으면 그 값을 반환 (한 번만)"""
+        if self.done:
+            return None
+
+        if not self.key_found:
+            m = _SEGMENT_1_KEY_RE.search(buf, max(0, self.pos - _SEGMENT_1_KEY_LOOKBACK))
+            if m is None:
+                self.pos = len(buf)
+                return None
+            self.key_found = True
+            self.pos = m.end()
+
+        if self.value_start is None:
+            while self.pos < len(buf) and buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos == len(buf):
+                return None
+            if buf[self.pos] != '"':
+                self.done = True  # 문자열 값이 아님 → 스트리밍 중 시작은 포기
+                return None
+            self.value_start = self.pos
+            self.pos += 1
+
+        # 닫는 따옴표 찾기 (앞에 연속된 백슬래시가 홀수 개면 이스케이프된 따옴표)
+        while True:
+            j = buf.find('"', self.pos)
+            if j < 0:
+                self.pos = len(buf)
+                return None
+            k = j
+            while buf[k - 1] == "\\":
+                k -= 1
+            self.pos = j + 1
+            if (j - k) % 2 == 0:
+                self.done = True
+                value = json.loads(buf[self.value_start:j + 1])
+                return value or None
+
+
+def _log_prompt_cache_usage(usage: Any) -> None:
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0) or 0
+    print(f"🧠 프롬프트 캐시: {cached}/{usage.prompt_tokens} 토큰 적중")
+
+
+def _stream_mascot_prompts(
+    request_kwargs: Dict[str, Any],
+    on_segment_1: Callable[[str], None],
+) -> str:
+    """
+    chat.completions 를 stream=True 로 호출해 전체 JSON 텍스트를 모아 반환한다.
+    segment_1_mascot_prompt 가 완성되는 순간 on_segment_1 을 한 번 호출.
+    """
+    stream = _get_openai_client().chat.completions.create(
+        **request_kwargs,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+
+    buf = ""
+    scanner = _Segment1Scanner()
+    for chunk in stream:
+        if chunk.usage is not None:
+            _log_prompt_cache_usage(chunk.usage)
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        buf += delta
+
+        segment_1 = scanner.feed(buf)
+        if segment_1 is not None:
+            on_segment_1(segment_1)
+
+    return buf
+
+
 def generate_mascot_video_prompts(
     image_path: str,
     festival_name_ko: str,
@@ -653,15 +696,20 @@ def generate_mascot_video_prompts(
     festival_location_ko: str,
     concept_description: str,
     program_name: Optional[List[str]] = None,
+    on_segment_1: Optional[Callable[[str], None]] = None,
+    image_bytes: Optional[bytes] = None,
 ) -> Dict[str, str]:
     """
     포스터 + 메타데이터 기반으로 Veo용 segment_1, segment_2 프롬프트 생성
+    - on_segment_1 을 주면 응답을 stream 으로 받으면서, segment_1_mascot_prompt 값이
+      완성되는 즉시 콜백을 호출한다 (segment_2 생성과 Veo 요청을 겹치기 위함).
+      스트리밍이 실패하면 일반 요청으로 다시 받는다.
     """
     print("🚀 마스코트 영상 프롬프트 생성 시작")
     
     program_name = program_name or []  # None 방어
-    programs_block = "\n".join(f"- {name}" for name in program_name)
-    mascot_data_url = _encode_image_to_small_data_url(image_path)
+    programs_block = _build_programs_block(tuple(program_name))
+    mascot_data_url = _encode_image_to_small_data_url(image_path, image_bytes=image_bytes)
 
     meta_json = json.dumps(
         {
@@ -672,6 +720,7 @@ def generate_mascot_video_prompts(
             "program_name" : program_name
         },
         ensure_ascii=False,
+        separators=(",", ":"),  # 공백 없는 compact JSON → user 메시지 토큰 절약
     )
 
     user_text = (
@@ -684,9 +733,12 @@ def generate_mascot_video_prompts(
         f"{programs_block}\n"
     )
 
-    resp = openai_client.chat.completions.create(
+    # system 메시지는 항상 MASCOT_VIDEO_SYSTEM_PROMPT 원문 그대로 (포맷팅 금지)
+    # → 동일 prefix 로 OpenAI 자동 프롬프트 캐시 적중. 가변 데이터는 user 메시지에만.
+    request_kwargs: Dict[str, Any] = dict(
         model="gpt-4o",
         response_format={"type": "json_object"},
+        prompt_cache_key=MASCOT_PROMPT_CACHE_KEY,
         messages=[
             {"role": "system", "content": MASCOT_VIDEO_SYSTEM_PROMPT},
             {
@@ -699,7 +751,27 @@ def generate_mascot_video_prompts(
         ],
     )
 
+    fired_segment_1: List[str] = []  # 콜백에 이미 넘긴 segment_1 (최대 1개)
+    if on_segment_1 is not None:
+        def _fire(segment_1: str) -> None:
+            fired_segment_1.append(segment_1)
+            on_segment_1(segment_1)
+
+        try:
+            content = _stream_mascot_prompts(request_kwargs, _fire)
+            return json.loads(content)
+        except Exception as e:
+            print(f"⚠️ 프롬프트 스트리밍 실패 → 일반 요청으로 재시도: {e}")
+
+    resp = _get_openai_client().chat.completions.create(**request_kwargs)
+    _log_prompt_cache_usage(getattr(resp, "usage", None))
+
     data = json.loads(resp.choices[0].message.content)
+    if fired_segment_1:
+        # 이미 Veo 요청에 쓴 segment_1 과 결과를 맞춘다
+        data["segment_1_mascot_prompt"] = fired_segment_1[0]
+    elif on_segment_1 is not None and data.get("segment_1_mascot_prompt"):
+        on_segment_1(data["segment_1_mascot_prompt"])
     return data
 
 
@@ -720,11 +792,11 @@ def _resolve_mascot_path_from_url(mascot_image_url: str, project_id: str | int)
         tmp_path = tmp_dir / f"mascot_input_{project_id}.png"
 
         print(f"🌐 원격 포스터 이미지 다운로드: {mascot_image_url}")
-        resp = requests.get(mascot_image_url, stream=True)
-        resp.raise_for_status()
-        with open(tmp_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with _get_http_client().stream("GET", mascot_image_url) as resp:
+            resp.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in resp.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
         return tmp_path
 
     # 로컬 경로 (프론트 public 기준 상대경로라고 가정)
@@ -737,6 +809,111 @@ def _resolve_mascot_path_from_url(mascot_image_url: str, project_id: str | int)
     return mascot_path
 
 
+# 인트로 디스크 캐시 (축제별로 같은 2초 인트로를 매번 인코딩하지 않도록)
+INTRO_CACHE_DIR = Path("generated_videos") / "intro_cache"
+INTRO_CACHE_MAX_ENTRIES = 32
+# 인트로 인코딩 결과에 영향을 주는 본편 파라미터
+_INTRO_CACHE_PARAM_KEYS = ("profile", "level", "fps", "time_base", "audio_codec", "sample_rate", "channels")
+
+
+def _prepare_mascot_target_dir(pNo: str) -> Path:
+    """FRONT public/data/promotion/M000001/{pNo}/video 폴더를 만들고 반환"""
+    rel_dir = Path("data") / "promotion" / PROMOTION_CODE / pNo / "video"
+    target_dir = Path(FRONT_PROJECT_ROOT) / "public" / rel_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    return target_dir
+
+
+def _intro_cache_key(
+    festival_name_ko: str,
+    festival_period_ko: str,
+    params: Dict[str, Any],
+    duration: float,
+    fps: int,
+) -> str:
+    """인트로 디스크 캐시 키 (자막/해상도/길이/fps + 본편 맞춤 코덱 파라미터)"""
+    match = "|".join(f"{k}={params.get(k)}" for k in _INTRO_CACHE_PARAM_KEYS)
+    raw = (
+        f"{festival_name_ko}|{festival_period_ko}|"
+        f"{params['width']}x{params['height']}|{duration}|{fps}|{match}"
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _evict_intro_cache(keep: int = INTRO_CACHE_MAX_ENTRIES) -> None:
+    """최근 사용(mtime) 순으로 keep 개만 남기고 오래된 인트로 캐시를 지운다."""
+    entries = sorted(
+        (p for p in INTRO_CACHE_DIR.glob("*.mp4") if not p.name.endswith(".tmp.mp4")),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for old in entries[keep:]:
+        old.unlink(missing_ok=True)
+
+
+def _create_mascot_intro(
+    pNo: str,
+    params: Dict[str, Any],
+    festival_name_ko: str,
+    festival_period_ko: str,
+) -> Path:
+    """
+    본편 파라미터(params)에 맞춘 2초 인트로를 만든다.
+    - 같은 (축제명, 기간, 해상도, 코덱 파라미터) 조합은 intro_cache 에서 바로 재사용
+    """
+    duration, fps = 2.0, 30
+    INTRO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    key = _intro_cache_key(festival_name_ko, festival_period_ko, params, duration, fps)
+    cached = INTRO_CACHE_DIR / f"{key}.mp4"
+    if cached.exists():
+        os.utime(cached)  # LRU 갱신
+        print(f"♻️ 인트로 캐시 적중: {cached}")
+        return cached
+
+    # pNo 별 임시 파일로 렌더링 후 원자적으로 캐시에 등록 (동시 실행 대비)
+    tmp_path = create_black_intro_with_text(
+        output_video=str(INTRO_CACHE_DIR / f"{key}_{pNo}.tmp.mp4"),
+        width=params["width"],
+        height=params["height"],
+        festival_name_ko=festival_name_ko,
+        festival_period_ko=festival_period_ko,
+        font_path=str(INTRO_FONT_PATH),
+        duration=duration,
+        fps=fps,
+        match_params=params,
+    )
+    os.replace(tmp_path, cached)
+    _evict_intro_cache()
+    return cached
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """
+    shutil.move 대체.
+    - 같은 파일시스템이면 os.replace (메타데이터만 변경)
+    - 다르면 os.copy_file_range (커널 내부 복사, reflink 가능 FS면 즉시) → 실패 시 shutil.copyfile
+    """
+    if src.stat().st_dev == dst.parent.stat().st_dev:
+        os.replace(src, dst)
+        return
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining > 0:
+            raise OSError("copy_file_range 가 파일 끝까지 복사하지 못했습니다.")
+    except (AttributeError, OSError):
+        # copy_file_range 미지원(비 Linux / 일부 FS 조합) → sendfile 기반 copyfile
+        shutil.copyfile(src, dst)
+    os.unlink(src)
+
+
 # --------------------------------------------------
 # 메인 엔트리: run_poster_video_to_editor
 # --------------------------------------------------
@@ -769,15 +946,53 @@ def run_mascot_video_to_editor(
     if not start_image_path.exists():
         raise FileNotFoundError(f"포스터 이미지가 존재하지 않습니다: {start_image_path}")
 
-    # 2. LLM 프롬프트 생성
-    prompts = generate_mascot_video_prompts(
-        image_path=str(start_image_path),
-        festival_name_ko=festival_name_ko,
-        festival_period_ko=festival_period_ko,
-        festival_location_ko=festival_location_ko,
-        concept_description=concept_description,
-        program_name=program_name,
+    # 마스코트 이미지는 한 번만 읽어서 Vision 썸네일/Veo 입력에 같이 쓴다
+    start_image_bytes = start_image_path.read_bytes()
+
+    # 인트로 렌더링과 최종 저장 폴더 준비는 본편 바이트와 무관하므로,
+    # LLM/Veo 대기 동안 (인트로는 추정 파라미터로) 미리 해 둔다
+    prep_executor = ThreadPoolExecutor(max_workers=2)
+    intro_future = prep_executor.submit(
+        _create_mascot_intro,
+        pNo,
+        dict(_VEO_OUTPUT_PARAMS),
+        festival_name_ko,
+        festival_period_ko,
     )
+    target_dir_future = prep_executor.submit(_prepare_mascot_target_dir, pNo)
+    prep_executor.shutdown(wait=False)
+
+    # segment_1 프롬프트가 스트림에서 완성되는 즉시 첫 8초 Veo 요청을 시작
+    veo_executor = ThreadPoolExecutor(max_workers=1)
+    segment_1_futures: list = []
+
+    def _start_segment_1(prompt: str) -> None:
+        print("⚡ segment_1 프롬프트 완성 → Veo 요청 먼저 시작")
+        segment_1_futures.append(
+            veo_executor.submit(
+                generate_image_to_video,
+                prompt=prompt,
+                start_image_path=str(start_image_path),
+                end_image_path=None,
+                download_name=f"mascot_segment_1_{pNo}_8s.mp4",
+                start_image_bytes=start_image_bytes,
+            )
+        )
+
+    # 2. LLM 프롬프트 생성
+    try:
+        prompts = generate_mascot_video_prompts(
+            image_path=str(start_image_path),
+            festival_name_ko=festival_name_ko,
+            festival_period_ko=festival_period_ko,
+            festival_location_ko=festival_location_ko,
+            concept_description=concept_description,
+            program_name=program_name,
+            on_segment_1=_start_segment_1,
+            image_bytes=start_image_bytes,
+        )
+    finally:
+        veo_executor.shutdown(wait=False)
 
     segment_1 = prompts.get("segment_1_mascot_prompt", "")
     segment_2 = prompts.get("segment_2_mascot_prompt", "")
@@ -787,13 +1002,17 @@ def run_mascot_video_to_editor(
 
     segment_paths: list[Path] = []
 
-    # 3. 첫 8초 이미지→비디오
-    video_1, path_1 = generate_image_to_video(
-        prompt=segment_1,
-        start_image_path=str(start_image_path),
-        end_image_path=None,
-        download_name=f"mascot_segment_1_{pNo}_8s.mp4",
-    )
+    # 3. 첫 8초 이미지→비디오 (스트리밍 중 이미 시작했으면 그 결과를 기다림)
+    if segment_1_futures:
+        video_1, path_1 = segment_1_futures[0].result()
+    else:
+        video_1, path_1 = generate_image_to_video(
+            prompt=segment_1,
+            start_image_path=str(start_image_path),
+            end_image_path=None,
+            download_name=f"mascot_segment_1_{pNo}_8s.mp4",
+            start_image_bytes=start_image_bytes,
+        )
     if path_1:
         segment_paths.append(path_1)
 
@@ -822,42 +1041,44 @@ def run_mascot_video_to_editor(
 
     # 5. 인트로(검정 배경 + 축제명/기간) 2초 생성 → 본편과 concat
 
-    # 5-1) 본편 해상도 추출
-    width, height = get_video_resolution(str(main_video_path))
+    # 5-1) 본편/인트로 코덱 파라미터를 probe 해서 stream copy 가능 여부 확인
+    #      (해상도는 probe 결과를 쓰고, probe 실패 시에만 Veo 기본 해상도 사용)
+    intro_video_path = intro_future.result()
+    main_params = probe_video_params(str(main_video_path))
+    stream_copy = can_stream_copy_concat(probe_video_params(str(intro_video_path)), main_params)
+    if main_params:
+        width, height = main_params["width"], main_params["height"]
+    else:
+        width, height = VEO_DEFAULT_RES
     print(f"🎞 본편 해상도: {width} x {height}")
 
-    # 5-2) 인트로 영상 생성 (generated_videos 폴더 하위)
-    DOWNLOAD_DIR = Path("generated_videos")
-    DOWNLOAD_DIR.mkdir(exist_ok=True)
-
-    intro_output = DOWNLOAD_DIR / f"mascot_intro_{pNo}_2s.mp4"
-    intro_video_path = create_black_intro_with_text(
-        output_video=str(intro_output),
-        width=width,
-        height=height,
-        festival_name_ko=festival_name_ko,
-        festival_period_ko=festival_period_ko,
-        font_path=str(INTRO_FONT_PATH),
-        duration=2.0,
-        fps=30,
-    )
-
-    # 5-3) 인트로 + 본편 concat (임시 최종본)
-    final_temp = concat_intro_and_main(
-        intro_video=str(intro_video_path),
-        main_video=str(main_video_path),
-        output_video=str(DOWNLOAD_DIR / f"mascot_video_{pNo}_with_intro.mp4"),
-    )
+    # 5-2) 미리 만든 인트로가 본편과 맞으면 stream copy concat,
+    #      아니면(또는 stream copy 가 실패하면) 인트로 재생성 + concat 을 ffmpeg 한 번으로 처리
+    final_output = Path("generated_videos") / f"mascot_video_{pNo}_with_intro.mp4"
+    final_temp = None
+    if stream_copy:
+        try:
+            final_temp = concat_stream_copy([intro_video_path, Path(main_video_path)], final_output)
+        except subprocess.CalledProcessError:
+            print("⚠️ stream copy concat 실패 → 인트로+본편을 한 번에 인코딩합니다.")
+    else:
+        print("⚠️ 미리 만든 인트로가 본편 파라미터와 달라 인트로+본편을 한 번에 인코딩합니다.")
+    if final_temp is None:
+        final_temp = render_intro_and_concat(
+            main_video=str(main_video_path),
+            output_video=str(final_output),
+            width=width,
+            height=height,
+            festival_name_ko=festival_name_ko,
+            festival_period_ko=festival_period_ko,
+            font_path=str(INTRO_FONT_PATH),
+            duration=2.0,
+            fps=(main_params or {}).get("fps") or 30,
+        )
 
     # 6. FRONT public/data/promotion/M000001/{pNo}/video/poster_video.mp4 로 이동
-    front_root = Path(FRONT_PROJECT_ROOT)
-    public_root = front_root / "public"
-    rel_dir = Path("data") / "promotion" / PROMOTION_CODE / pNo / "video"
-    target_dir = public_root / rel_dir
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    target_path = target_dir / "mascot_video.mp4"
-    shutil.move(str(final_temp), target_path)
+    target_path = target_dir_future.result() / "mascot_video.mp4"
+    _move_file(Path(final_temp), target_path)
     print(f"✅ 최종 포스터 홍보 영상 저장: {target_path}")
 
     db_rel_path = (Path("data") / "promotion" / PROMOTION_CODE / pNo / "video" / "mascot_video.mp4").as_posix()
@@ -1,38 +1,40 @@
 # app/service/poster/make_poster_video.py
 
 import os
-import time
+import asyncio
 import base64
+import hashlib
 import json
-import io
-import shutil
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import cv2
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
-from openai import OpenAI
+from openai import AsyncOpenAI
 from PIL import Image
 import subprocess
 
-load_dotenv()
-
-# --------------------------------------------------
-# 공통 설정
-# --------------------------------------------------
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-...
-FRONT_PROJECT_ROOT = os.getenv("FRONT_PROJECT_ROOT")
-...
-PROMOTION_CODE = "M000001"  # 고정값
+from app.service.video.ffmpeg_utils import (
+    concat_intro_and_main,
+    create_black_intro_with_text,
+    get_video_resolution,
+    h264_encoder_args,
+    probe_video_params,
+    render_intro_and_concat,
+    run_ffmpeg,
+)
 
 load_dotenv()
 
 # --------------------------------------------------
 # 공통 설정
 # --------------------------------------------------
+PROMOTION_CODE = "M000001"  # 고정값
 
 PROJECT_ROOT = os.getenv("PROJECT_ROOT")
 if not PROJECT_ROOT:
@@ -47,6 +49,8 @@ if not INTRO_FONT_PATH.exists():
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY 가 .env에 설정되어 있지 않습니다.")
+# Veo 결과 다운로드 URL 에 붙이는 쿼리 (다운로드마다 다시 만들지 않음)
+_GEMINI_KEY_QUERY = f"&key={GEMINI_API_KEY}"
 
 FRONT_PROJECT_ROOT = os.getenv("FRONT_PROJECT_ROOT")
 if not FRONT_PROJECT_ROOT:
@@ -54,20 +58,125 @@ if not FRONT_PROJECT_ROOT:
 
 
 veo_client = genai.Client(api_key=GEMINI_API_KEY)
-openai_client = OpenAI()
 VEO_MODEL = "veo-3.1-generate-preview"
+# 포스터 → Veo 프롬프트 JSON 생성용 (구조화 JSON 만 뽑으면 되므로 mini 모델로 충분)
+POSTER_PROMPT_MODEL = os.getenv("POSTER_PROMPT_MODEL", "gpt-4o-mini")
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # 다운로드 청크 (256 KiB)
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024  # 파일 쓰기 버퍼 (1 MiB) → write syscall 횟수 감소
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF_S = 0.3
+HTTP_RETRY_STATUS = frozenset({502, 503, 504})
+
+# 파이프라인 1회(asyncio.run 1회) 동안 공유하는 httpx 클라이언트.
+# 클라이언트 커넥션 풀은 이벤트 루프에 묶이므로 모듈 전역 대신 실행 단위로 둔다.
+_HTTP_CLIENT: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("poster_http_client", default=None)
+# 배치 실행(run_poster_video_to_editor_batch) 동안 공유하는 AsyncOpenAI 클라이언트
+_OPENAI_CLIENT: ContextVar[Optional[AsyncOpenAI]] = ContextVar("poster_openai_client", default=None)
+# 배치 실행 동안 모든 잡의 Veo 작업을 같이 폴링하는 _VeoPoller
+_VEO_POLLER: ContextVar[Optional["_VeoPoller"]] = ContextVar("poster_veo_poller", default=None)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """keep-alive 풀 + 연결 실패 재시도가 설정된 httpx.AsyncClient"""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(
+            retries=HTTP_RETRY_TOTAL,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        ),
+    )
+
+
+async def _download_to_file(url: str, output_path: Path) -> None:
+    """
+    url 을 output_path 로 스트리밍 다운로드.
+    - 실행 중인 파이프라인의 공유 클라이언트를 쓰고, 없으면 1회용 클라이언트 생성
+    - 502/503/504 는 지수 백오프(0.3s, 0.6s, 1.2s)로 재시도
+    """
+    client = _HTTP_CLIENT.get()
+    owns_client = client is None
+    if owns_client:
+        client = _new_http_client()
+
+    try:
+        for attempt in range(HTTP_RETRY_TOTAL + 1):
+            async with client.stream("GET", url) as response:
+                if response.status_code in HTTP_RETRY_STATUS and attempt < HTTP_RETRY_TOTAL:
+                    await asyncio.sleep(HTTP_RETRY_BACKOFF_S * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                with open(output_path, "wb", buffering=DOWNLOAD_WRITE_BUFFER) as f:
+                    async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                return
+    finally:
+        if owns_client:
+            await client.aclose()
 
 
 # --------------------------------------------------
 # Veo 헬퍼 (기존 로직 그대로 유지)
 # --------------------------------------------------
-def wait_for_operation(operation):
-    """비동기 작업이 완료될 때까지 기다리는 헬퍼 함수"""
-    while not operation.done:
-        print("⏳ 비디오 생성 대기 중... (10초 후 재확인)")
-        time.sleep(10)
-        operation = veo_client.operations.get(operation)
+class _VeoPoller:
+    """
+    진행 중인 Veo 작업들을 폴링 태스크 하나로 같이 확인한다.
+    - wait() 로 작업을 등록하면 공유 폴링 루프가 매 tick 마다
+      아직 안 끝난 작업들만 asyncio.gather 로 동시에 조회
+    - 2초부터 1.5배씩 늘려 최대 10초 간격 (대기 중인 작업이 없어지면 2초로 초기화)
+    - 등록된 작업이 모두 끝나면 폴링 태스크도 종료되고, 다음 wait() 때 다시 시작
+    """
 
+    def __init__(self) -> None:
+        self._new: List[Tuple[Any, asyncio.Future]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, operation):
+        """operation 이 끝날 때까지 기다렸다가 최신 operation 을 반환"""
+        if operation.done:
+            return operation
+        future = asyncio.get_running_loop().create_future()
+        self._new.append((operation, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        pending: List[Tuple[Any, asyncio.Future]] = []
+        delay = 2.0
+        while True:
+            pending += self._new
+            self._new.clear()
+            pending = [(op, fut) for op, fut in pending if not fut.done()]  # 취소된 대기자 제외
+            if not pending:
+                return
+
+            print(f"⏳ 비디오 생성 대기 중... ({len(pending)}개, {delay:.1f}초 후 재확인)")
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 10)
+
+            refreshed = await asyncio.gather(
+                *(veo_client.aio.operations.get(op) for op, _ in pending),
+                return_exceptions=True,
+            )
+            still_pending = []
+            for (_, fut), op in zip(pending, refreshed):
+                if fut.done():
+                    continue
+                if isinstance(op, BaseException):
+                    fut.set_exception(op)
+                elif op.done:
+                    fut.set_result(op)
+                else:
+                    still_pending.append((op, fut))
+            pending = still_pending
+            if not pending:
+                delay = 2.0
+
+
+def _operation_video(operation):
+    """완료된 operation → 첫 번째 generated_video (실패면 None)"""
     if operation.error:
         print(f"❌ 비디오 생성 실패: {operation.error}")
         return None
@@ -78,9 +187,19 @@ def wait_for_operation(operation):
         return video_result
 
 
-def download_video(video_file, output_filename: str) -> Optional[Path]:
+async def wait_for_operation(operation):
+    """
+    비동기 작업이 완료될 때까지 기다리는 헬퍼 함수.
+    배치 실행 중이면 배치 전체가 공유하는 폴러에 등록하고, 아니면 이 작업 전용 폴러로 기다린다.
+    """
+    poller = _VEO_POLLER.get() or _VeoPoller()
+    operation = await poller.wait(operation)
+    return _operation_video(operation)
+
+
+async def download_video(video_file, output_filename: str) -> Optional[Path]:
     """
-    requests 라이브러리를 사용하여 비디오 URI에서 직접 다운로드합니다.
+    공유 httpx 클라이언트로 비디오 URI에서 직접 다운로드합니다.
     """
     DOWNLOAD_DIR = Path("generated_videos")
     DOWNLOAD_DIR.mkdir(exist_ok=True)
@@ -88,45 +207,42 @@ def download_video(video_file, output_filename: str) -> Optional[Path]:
     output_path = DOWNLOAD_DIR / output_filename
     video_uri = video_file.video.uri
 
-    download_url = f"{video_uri}&key={GEMINI_API_KEY}" if "key=" not in video_uri else video_uri
+    download_url = video_uri + _GEMINI_KEY_QUERY if "key=" not in video_uri else video_uri
 
     try:
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        await _download_to_file(download_url, output_path)
 
         print(f"⬇️ 비디오 다운로드 완료: {output_path.resolve()}")
         return output_path
     except Exception as e:
-        print(f"❌ 비디오 다운로드 실패 (requests 오류): {e}")
+        print(f"❌ 비디오 다운로드 실패 (httpx 오류): {e}")
         return None
 
 
 def _read_and_encode_image(image_path: str) -> types.Image:
-    """로컬 이미지를 읽어 Base64로 인코딩하고 types.Image 객체로 반환합니다."""
+    """
+    로컬 이미지를 읽어 types.Image 객체로 반환합니다.
+    - image_bytes 에는 원본 bytes 를 그대로 넘긴다 (직렬화 시 SDK가 base64 처리)
+    """
     image_path = Path(image_path)
-    if not image_path.exists():
-        raise FileNotFoundError(f"이미지 파일이 존재하지 않습니다: {image_path}")
 
     mime_type = "image/jpeg"
     if image_path.suffix.lower() == ".png":
         mime_type = "image/png"
 
-    with open(image_path, "rb") as f:
-        image_bytes = f.read()
-
-    base64_encoded_data = base64.b64encode(image_bytes).decode("utf-8")
+    # exists() 로 한 번 더 stat 하지 않고 읽기 실패를 그대로 변환
+    try:
+        image_bytes = image_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"이미지 파일이 존재하지 않습니다: {image_path}") from None
 
     return types.Image(
-        image_bytes=base64_encoded_data,
+        image_bytes=image_bytes,
         mime_type=mime_type,
     )
 
 
-def generate_image_to_video(
+async def generate_image_to_video(
     prompt: str,
     start_image_path: str,
     end_image_path: str = None,
@@ -158,23 +274,23 @@ def generate_image_to_video(
 
     video_config = types.GenerateVideosConfig(**config_params) if config_params else None
 
-    operation = veo_client.models.generate_videos(
+    operation = await veo_client.aio.models.generate_videos(
         model=VEO_MODEL,
         prompt=prompt,
         image=start_frame_image,
         config=video_config,
     )
 
-    result_video = wait_for_operation(operation)
+    result_video = await wait_for_operation(operation)
 
     download_path = None
     if result_video:
-        download_path = download_video(result_video, download_name)
+        download_path = await download_video(result_video, download_name)
 
     return result_video, download_path
 
 
-def extend_video(
+async def extend_video(
     existing_video,
     extension_prompt: str,
     duration_s: int = 8,
@@ -194,18 +310,18 @@ def extend_video(
 
     video_config = types.GenerateVideosConfig()
 
-    operation = veo_client.models.generate_videos(
+    operation = await veo_client.aio.models.generate_videos(
         model=VEO_MODEL,
         prompt=extension_prompt,
         video=existing_video.video,
         config=video_config,
     )
 
-    result_video = wait_for_operation(operation)
+    result_video = await wait_for_operation(operation)
 
     download_path = None
     if result_video:
-        download_path = download_video(result_video, download_name)
+        download_path = await download_video(result_video, download_name)
 
     return result_video, download_path
 
@@ -243,7 +359,7 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
     ]
 
     try:
-        subprocess.run(ffmpeg_command, check=True, capture_output=True, text=True)
+        run_ffmpeg(ffmpeg_command)
         print(f"✅ 비디오 연결 완료: {output_path.resolve()}")
         os.remove(list_file_path)
         return output_path
@@ -260,206 +376,6 @@ def concatenate_videos(input_paths: list[Path], output_filename: str) -> Optiona
 
 
 
-# --------------------------------------------------
-# FFmpeg / 인트로 관련 헬퍼
-# --------------------------------------------------
-
-def ffmpeg_escape_text(s: str) -> str:
-    """
-    ffmpeg drawtext용 텍스트 escape 헬퍼.
-    - \, :, ' 정도만 처리
-    """
-    return (
-        s.replace("\\", "\\\\")  # 역슬래시 → \\
-         .replace(":", "\\:")    # 콜론 → \:
-         .replace("'", "\\'")    # 작은따옴표 → \'
-    )
-
-
-def ffmpeg_escape_font_path(path: str) -> str:
-    """
-    drawtext fontfile용 경로 escape:
-    - 백슬래시 → \\
-    - 콜론 → \:
-    """
-    p = path.replace("\\", "\\\\")
-    p = p.replace(":", "\\:")
-    return p
-
-
-def get_video_resolution(input_video: str, fallback=(1920, 1080)) -> tuple[int, int]:
-    """
-    ffprobe로 (width, height) 가져오되,
-    실패하면 fallback 해상도(기본 1920x1080)를 리턴.
-    """
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "json",
-        input_video,
-    ]
-    proc = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
-
-    if proc.returncode != 0:
-        print("⚠️ ffprobe 실패, fallback 해상도 사용:", fallback)
-        print("ffprobe stderr:")
-        print(proc.stderr)
-        return fallback
-
-    info = json.loads(proc.stdout)
-    stream = info["streams"][0]
-    return int(stream["width"]), int(stream["height"])
-
-
-def create_black_intro_with_text(
-    output_video: str,
-    width: int,
-    height: int,
-    festival_name_ko: str,
-    festival_period_ko: str,
-    font_path: str,
-    duration: float = 2.0,
-    fps: int = 30,
-    fontsize_title: int = 56,
-    fontsize_period: int = 40,
-) -> Path:
-    """
-    검정 배경 위에 축제명/기간 자막 2줄만 있는 인트로 영상 생성.
-    """
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # 텍스트 / 폰트 escape (add_intro_caption에서 쓰던 방식 재사용)
-    fontfile = ffmpeg_escape_font_path(font_path)
-    title_text = ffmpeg_escape_text(festival_name_ko)
-    period_text = ffmpeg_escape_text(festival_period_ko)
-
-    drawtext = (
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{title_text}':"
-        f"fontsize={fontsize_title}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=20:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)-50"
-        ","
-        "drawtext="
-        f"fontfile='{fontfile}':"
-        f"text='{period_text}':"
-        f"fontsize={fontsize_period}:"
-        "fontcolor=white:"
-        "box=1:boxcolor=black@0.5:boxborderw=16:"
-        "x=(w-text_w)/2:"
-        "y=(h/2)+30"
-    )
-
-    cmd = [
-        "ffmpeg",
-        "-f", "lavfi",
-        "-i", f"color=c=black:s={width}x{height}:d={duration}:r={fps}",
-        "-vf", drawtext,
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (intro):")
-    print(" ".join(cmd))
-    print("  raw font_path =", font_path)
-    print("  fontfile     =", fontfile)
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg intro stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg intro 생성 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
-
-def concat_intro_and_main(
-    intro_video: str,
-    main_video: str,
-    output_video: str,
-) -> Path:
-    """
-    인트로 영상(무음) + 본편 영상 을 하나로 이어붙이기.
-    - 비디오 2개 concat
-    - 오디오는 본편(두 번째 입력) 것을 그대로 사용
-    """
-    intro_path = Path(intro_video)
-    main_path = Path(main_video)
-    out_path = Path(output_video)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if not intro_path.exists():
-        raise FileNotFoundError(f"intro 없음: {intro_path}")
-    if not main_path.exists():
-        raise FileNotFoundError(f"main 없음: {main_path}")
-
-    cmd = [
-        "ffmpeg",
-        "-i", str(intro_path),
-        "-i", str(main_path),
-        "-filter_complex", "[0:v][1:v]concat=n=2:v=1:a=0[v]",
-        "-map", "[v]",
-        "-map", "1:a?",   # 본편에 오디오 있으면 복사, 없으면 무시
-        "-c:v", "libx264",
-        "-c:a", "copy",
-        "-pix_fmt", "yuv420p",
-        "-y",
-        str(out_path),
-    ]
-
-    print("▶ ffmpeg (concat intro+main):")
-    print(" ".join(cmd))
-
-    try:
-        completed = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-        )
-        if completed.stderr:
-            print("ffmpeg concat stderr (경고/로그):")
-            print(completed.stderr)
-    except subprocess.CalledProcessError as e:
-        print("❌ ffmpeg concat 실패")
-        print("stdout:")
-        print(e.stdout)
-        print("stderr:")
-        print(e.stderr)
-        raise
-
-    return out_path
-
 # --------------------------------------------------
 # LLM: 포스터 기반 Veo 프롬프트 생성
 # --------------------------------------------------
@@ -603,20 +519,60 @@ def _encode_image_to_small_data_url(image_path: str, max_size: int = 256, qualit
     data:image/jpeg;base64,... 형태로 변환 (TPM 방지용).
     """
     p = Path(image_path)
-    if not p.exists():
-        raise FileNotFoundError(f"포스터 파일을 찾을 수 없음: {image_path}")
-
-    img = Image.open(p).convert("RGB")
+    try:
+        img = Image.open(p)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"포스터 파일을 찾을 수 없음: {image_path}") from None
+    # JPEG이면 libjpeg DCT 스케일링(1/2,1/4,1/8)으로 축소 디코딩 (PNG 등은 no-op)
+    img.draft("RGB", (max_size * 2, max_size * 2))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
     img.thumbnail((max_size, max_size), Image.LANCZOS)
 
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=quality, optimize=True)
-    buf.seek(0)
-    b64 = base64.b64encode(buf.read()).decode("utf-8")
+    # JPEG 인코딩은 OpenCV(libjpeg-turbo)로 (PIL optimize=True 의 Huffman 최적화 패스 생략)
+    bgr = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2BGR)
+    ok, buf = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError(f"썸네일 JPEG 인코딩 실패: {image_path}")
+
+    # ndarray 버퍼를 복사 없이 바로 인코딩, base64 는 ASCII 전용이라 ascii 디코더 사용
+    b64 = base64.b64encode(buf.data).decode("ascii")
     return f"data:image/jpeg;base64,{b64}"
 
 
-def generate_poster_video_prompts(
+PROMPT_CACHE_DIR = Path("generated_videos") / ".prompt_cache"
+PROMPT_CACHE_MAX_ENTRIES = 256
+
+
+def _prompt_cache_path(key: str) -> Path:
+    """LLM 프롬프트 결과 디스크 캐시 경로"""
+    return PROMPT_CACHE_DIR / f"{key}.json"
+
+
+def _prompt_cache_set(cache_path: Path, data: Dict[str, str]) -> None:
+    """
+    프롬프트 캐시 저장
+    - 프로세스별 임시 파일에 쓴 뒤 os.replace (동시 실행 시에도 반쯤 쓴 JSON 이 안 보이게)
+    - 최근 사용(mtime) 순으로 PROMPT_CACHE_MAX_ENTRIES 개만 남김
+    """
+    try:
+        PROMPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, cache_path)
+
+        entries = sorted(
+            PROMPT_CACHE_DIR.glob("*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for old in entries[PROMPT_CACHE_MAX_ENTRIES:]:
+            old.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"⚠️ 프롬프트 캐시 저장 실패(무시): {e}")
+
+
+async def generate_poster_video_prompts(
     image_path: str,
     festival_name_ko: str,
     festival_period_ko: str,
@@ -628,7 +584,8 @@ def generate_poster_video_prompts(
     """
     print("🚀 포스터 영상 프롬프트 생성 시작")
 
-    data_url = _encode_image_to_small_data_url(image_path)
+    # 썸네일 인코딩은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드에서
+    data_url = await asyncio.to_thread(_encode_image_to_small_data_url, image_path)
 
     meta_json = json.dumps(
         {
@@ -640,6 +597,19 @@ def generate_poster_video_prompts(
         ensure_ascii=False,
     )
 
+    # 같은 포스터 썸네일 + 메타데이터 + 모델이면 이전 결과를 그대로 재사용
+    cache_key = hashlib.sha256(
+        "\n".join([POSTER_PROMPT_MODEL, meta_json, data_url]).encode("utf-8")
+    ).hexdigest()
+    cache_path = _prompt_cache_path(cache_key)
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        os.utime(cache_path)  # LRU 갱신
+        print(f"♻️ 프롬프트 캐시 적중: {cache_path}")
+        return cached
+    except (OSError, ValueError):
+        pass  # 캐시 없음/방금 지워짐/손상 → 새로 생성
+
     user_text = (
         "You will receive FESTIVAL METADATA (in JSON) and a POSTER IMAGE.\n"
         "Use both to design segment_1_prompt and segment_2_prompt as Veo-ready prompts.\n\n"
@@ -647,8 +617,8 @@ def generate_poster_video_prompts(
         f"Festival metadata JSON:\n{meta_json}"
     )
 
-    resp = openai_client.chat.completions.create(
-        model="gpt-4o",
+    request_kwargs: Dict[str, Any] = dict(
+        model=POSTER_PROMPT_MODEL,
         response_format={"type": "json_object"},
         messages=[
             {"role": "system", "content": VIDEO_SYSTEM_PROMPT},
@@ -662,7 +632,18 @@ def generate_poster_video_prompts(
         ],
     )
 
+    # 배치 실행 중이면 공유 클라이언트 사용, 아니면
+    # (AsyncOpenAI 의 커넥션 풀은 이벤트 루프에 묶이므로) asyncio.run 마다 새로 만든다
+    shared_client = _OPENAI_CLIENT.get()
+    if shared_client is not None:
+        resp = await shared_client.chat.completions.create(**request_kwargs)
+    else:
+        async with AsyncOpenAI() as openai_client:
+            resp = await openai_client.chat.completions.create(**request_kwargs)
+
     data = json.loads(resp.choices[0].message.content)
+
+    await asyncio.to_thread(_prompt_cache_set, cache_path, data)
     return data
 
 
@@ -670,11 +651,12 @@ def generate_poster_video_prompts(
 # URL/상대경로 → 실제 파일 경로 변환
 # --------------------------------------------------
 
-def _resolve_poster_path_from_url(poster_image_url: str, project_id: str | int) -> Path:
+async def _resolve_poster_path_from_url(poster_image_url: str, project_id: str | int) -> Path:
     """
     poster_image_url 이
     - http 로 시작하면: 다운로드해서 임시 파일로 사용
     - / 로 시작하거나 data/... 형태면: FRONT_PROJECT_ROOT/public 기준 상대경로로 사용
+    반환하는 경로는 존재가 확인된 파일 (없으면 FileNotFoundError).
     """
     # http(s) URL 인 경우 → 임시 다운로드
     if poster_image_url.startswith("http://") or poster_image_url.startswith("https://"):
@@ -683,11 +665,7 @@ def _resolve_poster_path_from_url(poster_image_url: str, project_id: str | int)
         tmp_path = tmp_dir / f"poster_input_{project_id}.png"
 
         print(f"🌐 원격 포스터 이미지 다운로드: {poster_image_url}")
-        resp = requests.get(poster_image_url, stream=True)
-        resp.raise_for_status()
-        with open(tmp_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        await _download_to_file(poster_image_url, tmp_path)
         return tmp_path
 
     # 로컬 경로 (프론트 public 기준 상대경로라고 가정)
@@ -697,6 +675,10 @@ def _resolve_poster_path_from_url(poster_image_url: str, project_id: str | int)
     # poster_image_url 이 "/data/..." 이거나 "data/..." 인 케이스
     rel = poster_image_url.lstrip("/")  # 맨 앞 / 제거
     poster_path = public_root / rel
+    try:
+        os.stat(poster_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"포스터 이미지가 존재하지 않습니다: {poster_path}") from None
     return poster_path
 
 
@@ -704,6 +686,14 @@ def _resolve_poster_path_from_url(poster_image_url: str, project_id: str | int)
 # 메인 엔트리: run_poster_video_to_editor
 # --------------------------------------------------
 
+def _prepare_poster_target_dir(pNo: str) -> Path:
+    """FRONT public/data/promotion/M000001/{pNo}/video 폴더를 만들고 반환"""
+    rel_dir = Path("data") / "promotion" / PROMOTION_CODE / pNo / "video"
+    target_dir = Path(FRONT_PROJECT_ROOT) / "public" / rel_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    return target_dir
+
+
 def run_poster_video_to_editor(
     *,
     festival_name_ko: str,
@@ -723,16 +713,91 @@ def run_poster_video_to_editor(
     4) FFmpeg으로 15초 합치기
     5) FRONT_PROJECT_ROOT/public/data/promotion/M000001/{project_id}/video/poster_video.mp4 저장
     6) DB 저장용 dict 4개 필드 반환
+
+    (내부는 asyncio 로 동작 — 동기 FastAPI 핸들러에서 그대로 호출 가능)
     """
-    pNo = str(project_id)
+    return asyncio.run(
+        _run_poster_video_async(
+            festival_name_ko=festival_name_ko,
+            festival_period_ko=festival_period_ko,
+            festival_location_ko=festival_location_ko,
+            project_id=project_id,
+            poster_image_url=poster_image_url,
+            concept_description=concept_description,
+        )
+    )
+
 
-    # 1. 포스터 이미지 실제 경로
-    start_image_path = _resolve_poster_path_from_url(poster_image_url, pNo)
-    if not start_image_path.exists():
-        raise FileNotFoundError(f"포스터 이미지가 존재하지 않습니다: {start_image_path}")
+def run_poster_video_to_editor_batch(
+    jobs: List[Dict[str, Any]],
+    concurrency: int = 4,
+) -> List[Any]:
+    """
+    여러 프로젝트의 포스터 영상을 동시에 생성한다.
+    - jobs: run_poster_video_to_editor 키워드 인자 dict 목록
+    - 한 실행 안에서는 segment_1 → segment_2 순서가 필요하지만 실행끼리는 독립이므로,
+      Veo 대기(수 분)를 최대 concurrency 개까지 겹친다
+    - AsyncOpenAI / httpx 클라이언트와 Veo 작업 폴러는 배치 전체가 하나씩 공유
+    - 반환: jobs 순서대로 결과 dict 또는 실패한 경우 그 예외 객체
+    """
+    return asyncio.run(_run_poster_video_batch_async(jobs, concurrency))
+
+
+async def _run_poster_video_batch_async(
+    jobs: List[Dict[str, Any]],
+    concurrency: int,
+) -> List[Any]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run_one(job: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await _run_poster_video_async(**job)
+
+    async with _new_http_client() as http_client, AsyncOpenAI() as openai_client:
+        http_token = _HTTP_CLIENT.set(http_client)
+        openai_token = _OPENAI_CLIENT.set(openai_client)
+        poller_token = _VEO_POLLER.set(_VeoPoller())
+        try:
+            tasks = [asyncio.create_task(_run_one(job)) for job in jobs]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            _VEO_POLLER.reset(poller_token)
+            _OPENAI_CLIENT.reset(openai_token)
+            _HTTP_CLIENT.reset(http_token)
+
+
+async def _run_poster_video_async(**kwargs: Any) -> Dict[str, Any]:
+    """파이프라인 1회 동안 HTTP 다운로드(포스터/segment_1/segment_2)가 같은 커넥션 풀을 쓰도록 감싼다."""
+    if _HTTP_CLIENT.get() is not None:
+        # 배치 실행 중: 배치 전체가 공유하는 클라이언트를 그대로 사용
+        return await _run_poster_video_pipeline(**kwargs)
+
+    async with _new_http_client() as http_client:
+        token = _HTTP_CLIENT.set(http_client)
+        try:
+            return await _run_poster_video_pipeline(**kwargs)
+        finally:
+            _HTTP_CLIENT.reset(token)
+
+
+async def _run_poster_video_pipeline(
+    *,
+    festival_name_ko: str,
+    festival_period_ko: str,
+    festival_location_ko: str,
+    project_id: int | str,
+    poster_image_url: str,
+    concept_description: str,
+) -> Dict[str, Any]:
+    pNo = str(project_id)
 
+    # 1. 포스터 이미지 실제 경로 (+ 최종 저장 폴더 준비를 같이)
+    start_image_path, target_dir = await asyncio.gather(
+        _resolve_poster_path_from_url(poster_image_url, pNo),
+        asyncio.to_thread(_prepare_poster_target_dir, pNo),
+    )
     # 2. LLM 프롬프트 생성
-    prompts = generate_poster_video_prompts(
+    prompts = await generate_poster_video_prompts(
         image_path=str(start_image_path),
         festival_name_ko=festival_name_ko,
         festival_period_ko=festival_period_ko,
@@ -749,7 +814,7 @@ def run_poster_video_to_editor(
     segment_paths: list[Path] = []
 
     # 3. 첫 8초 이미지→비디오
-    video_1, path_1 = generate_image_to_video(
+    video_1, path_1 = await generate_image_to_video(
         prompt=segment_1,
         start_image_path=str(start_image_path),
         end_image_path=None,
@@ -761,7 +826,7 @@ def run_poster_video_to_editor(
     # 4. 확장 7초
     video_2, path_2 = (None, None)
     if video_1:
-        video_2, path_2 = extend_video(
+        video_2, path_2 = await extend_video(
             existing_video=video_1,
             extension_prompt=segment_2,
             duration_s=7,
@@ -782,43 +847,66 @@ def run_poster_video_to_editor(
     main_video_path = path_2  # ← Veo 두 번째 결과를 최종 본편으로 사용
 
     # 5. 인트로(검정 배경 + 축제명/기간) 2초 생성 → 본편과 concat
+    #    (ffmpeg/ffprobe 는 블로킹이라 스레드에서 실행)
 
-    # 5-1) 본편 해상도 추출
-    width, height = get_video_resolution(str(main_video_path))
+    # 5-1) 본편 코덱 파라미터/해상도 추출
+    main_params = await asyncio.to_thread(probe_video_params, str(main_video_path))
+    if main_params:
+        width, height = main_params["width"], main_params["height"]
+    else:
+        width, height = await asyncio.to_thread(get_video_resolution, str(main_video_path))
     print(f"🎞 본편 해상도: {width} x {height}")
 
-    # 5-2) 인트로 영상 생성 (generated_videos 폴더 하위)
     DOWNLOAD_DIR = Path("generated_videos")
     DOWNLOAD_DIR.mkdir(exist_ok=True)
-
-    intro_output = DOWNLOAD_DIR / f"poster_intro_{pNo}_2s.mp4"
-    intro_video_path = create_black_intro_with_text(
-        output_video=str(intro_output),
-        width=width,
-        height=height,
-        festival_name_ko=festival_name_ko,
-        festival_period_ko=festival_period_ko,
-        font_path=str(INTRO_FONT_PATH),
-        duration=2.0,
-        fps=30,
-    )
-
-    # 5-3) 인트로 + 본편 concat (임시 최종본)
-    final_temp = concat_intro_and_main(
-        intro_video=str(intro_video_path),
-        main_video=str(main_video_path),
-        output_video=str(DOWNLOAD_DIR / f"poster_video_{pNo}_with_intro.mp4"),
-    )
-
-    # 6. FRONT public/data/promotion/M000001/{pNo}/video/poster_video.mp4 로 이동
-    front_root = Path(FRONT_PROJECT_ROOT)
-    public_root = front_root / "public"
-    rel_dir = Path("data") / "promotion" / PROMOTION_CODE / pNo / "video"
-    target_dir = public_root / rel_dir
-    target_dir.mkdir(parents=True, exist_ok=True)
-
     target_path = target_dir / "poster_video.mp4"
-    shutil.move(str(final_temp), target_path)
+    # 최종 ffmpeg 출력은 저장 폴더에 바로 쓴다 (다른 파일시스템이어도 복사 없음).
+    # 같은 폴더의 .tmp.mp4 로 쓴 뒤 rename 하고, 실패하면 지워서 프론트에 반쯤 쓴 파일이 남지 않게 한다.
+    temp_path = target_dir / f"poster_video_{pNo}.tmp.mp4"
+
+    try:
+        if main_params and main_params.get("codec") == "h264":
+            # 5-2a) 본편과 같은 파라미터로 2초 인트로만 인코딩 → stream copy concat
+            intro_video_path = await asyncio.to_thread(
+                create_black_intro_with_text,
+                output_video=str(DOWNLOAD_DIR / f"poster_intro_{pNo}_2s.mp4"),
+                width=width,
+                height=height,
+                festival_name_ko=festival_name_ko,
+                festival_period_ko=festival_period_ko,
+                font_path=str(INTRO_FONT_PATH),
+                duration=2.0,
+                fps=30,
+                match_params=main_params,
+            )
+            final_temp = await asyncio.to_thread(
+                concat_intro_and_main,
+                intro_video=str(intro_video_path),
+                main_video=str(main_video_path),
+                output_video=str(temp_path),
+                # 포스터 영상은 하드웨어 인코더 우선 (없으면 libx264 veryfast)
+                encoder_args=h264_encoder_args(),
+            )
+        else:
+            # 5-2b) 본편 파라미터를 못 맞추면 인트로 생성 + concat 을 ffmpeg 한 번으로
+            final_temp = await asyncio.to_thread(
+                render_intro_and_concat,
+                main_video=str(main_video_path),
+                output_video=str(temp_path),
+                width=width,
+                height=height,
+                festival_name_ko=festival_name_ko,
+                festival_period_ko=festival_period_ko,
+                font_path=str(INTRO_FONT_PATH),
+                duration=2.0,
+                fps=30,
+                encoder_args=h264_encoder_args(),
+            )
+
+        # 6. FRONT public/data/promotion/M000001/{pNo}/video/poster_video.mp4 로 이름 변경
+        os.replace(final_temp, target_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
     print(f"✅ 최종 포스터 홍보 영상 저장: {target_path}")
 
     db_rel_path = (Path("data") / "promotion" / PROMOTION_CODE / pNo / "video" / "poster_video.mp4").as_posix()
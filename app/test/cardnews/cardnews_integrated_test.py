@@ -1,10 +1,14 @@
 from __future__ import annotations
 from dotenv import load_dotenv
+import asyncio
+import io
 import json
+import shutil
 from pathlib import Path
 from datetime import datetime
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 
 from app.service.cardnews.cardnews_prompt_service import build_prompt_for_review
@@ -12,6 +16,20 @@ from app.service.cardnews.replicate_image_generator import generate_image_from_p
 from app.service.cardnews.text_overlay_service import compose_cardnews
 from app.domain.cardnews.cardnews_prompt_model import TableData, TableCell, TableRow
 
+# orjson 이 있으면 UTF-8 바이트로 바로 직렬화 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json_bytes(obj) -> bytes:
+    """indent=2, 한글 그대로(ensure_ascii=False) JSON 을 UTF-8 바이트로"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 # ====== 1. 기본 경로 설정 ======
 BASE_DIR = Path(__file__).resolve().parents[3]
 load_dotenv(BASE_DIR / ".env")
@@ -20,6 +38,7 @@ OUTPUT_DIR = BASE_DIR / "data" / "output"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 FONTS_BASE = BASE_DIR / "data" / "nanum-all_new" / "나눔 글꼴"
+FONTS_DIR_STR = str(FONTS_BASE)
 
 # ====== 2. 테스트용 레퍼런스 데이터 ======
 TEST_REFERENCES = [
@@ -68,39 +87,93 @@ TEST_TEXT = {
 
 
 # ====== 이미지 URL 다운로드 ======
-def download_image_to_local(url: str, save_path: Path) -> Path:
-    resp = requests.get(url)
-    img = Image.open(BytesIO(resp.content)).convert("RGB")
-    img.save(save_path)
-    return save_path
+def _new_session() -> requests.Session:
+    """keep-alive 커넥션 풀 + 일시적 오류 재시도를 갖춘 공용 Session"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
-# ====== 실제 테스트 수행 ======
-def run_test():
+SESSION = _new_session()
 
-    print("🔥 Step1: 프롬프트 생성 중...")
-    prompt_data = build_prompt_for_review(
-        references=TEST_REFERENCES,
-        user_theme="봄 감성 + 가족 중심",
-        keywords=["벚꽃", "가족", "음악"]
-    )
-    vp = prompt_data["visual_prompt"]
-    style = prompt_data["style_name"]
-    print("✓ 프롬프트 생성 완료")
+# 응답 Content-Type → 그대로 저장해도 되는 확장자
+CONTENT_TYPE_SUFFIX = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+}
 
-    print("🔥 Step2: 배경 이미지 생성 중...")
-    bg_url = generate_image_from_prompt(vp)
-    print("✓ Replicate 이미지 생성 완료:", bg_url)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IMAGE_MAGICS = (PNG_SIGNATURE, b"\xff\xd8\xff", b"RIFF")
+# IHDR color type: 2 = RGB, 6 = RGBA → compose_cardnews 에 그대로 넘겨도 되는 PNG
+PNG_DIRECT_COLOR_TYPES = (2, 6)
+SNIFF_BYTES = 26  # 시그니처(8) + IHDR 길이/타입(8) + width/height(8) + bit depth(1) + color type(1)
 
-    # ===== URL → 로컬로 다운로드 =====
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    local_bg_path = OUTPUT_DIR / f"background_{timestamp}.png"
-    download_image_to_local(bg_url, local_bg_path)
 
-    final_png = OUTPUT_DIR / f"cardnews_test_{timestamp}.png"
-    result_json = OUTPUT_DIR / f"cardnews_test_{timestamp}.json"
+def _sniff_suffix(head: bytes) -> str | None:
+    """
+    파일 앞부분 매직 바이트로 '재인코딩 없이 저장해도 되는' 확장자 판별
+    - PNG 는 RGB/RGBA 일 때만 (팔레트/그레이스케일은 Pillow 로 RGB 변환)
+    """
+    if head.startswith(PNG_SIGNATURE):
+        if len(head) >= SNIFF_BYTES and head[25] in PNG_DIRECT_COLOR_TYPES:
+            return ".png"
+        return None
+    if head.startswith(IMAGE_MAGICS[1]):
+        return ".jpg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def download_image_to_local(url: str, save_path: Path) -> Path:
+    """
+    응답 본문을 메모리에 통째로 올리지 않고 스트리밍으로 저장
+    - 매직 바이트(없으면 Content-Type)가 저장 확장자와 같으면 재인코딩 없이 바이트 그대로 복사
+      (Replicate 가 주는 RGB/RGBA PNG 는 Pillow 를 아예 거치지 않음)
+    - 다르면 Pillow 로 디코드해서 RGB 로 저장
+    """
+    with SESSION.get(url, stream=True, timeout=(5, 30)) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+
+        head = resp.raw.read(SNIFF_BYTES)
+        if head.startswith(IMAGE_MAGICS):
+            source_suffix = _sniff_suffix(head)
+        else:
+            content_type = resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            source_suffix = CONTENT_TYPE_SUFFIX.get(content_type)
 
-    print("🔥 Step3: 카드뉴스 오버레이 생성 중...")
+        if source_suffix == save_path.suffix.lower():
+            with open(save_path, "wb") as f:
+                f.write(head)
+                shutil.copyfileobj(resp.raw, f, length=65536)
+            return save_path
+
+        img = Image.open(io.BytesIO(head + resp.raw.read()))
+        img.draft("RGB", img.size)
+        img.convert("RGB").save(save_path, optimize=True)
+    return save_path
+
+
+# ====== 카드뉴스 오버레이 + JSON 기록 ======
+def compose_and_record(vp: str, style: str, bg_url: str, local_bg_path: Path, tag: str) -> Path:
+    final_png = OUTPUT_DIR / f"cardnews_test_{tag}.png"
+    result_json = final_png.with_suffix(".json")
+    bg_path_str = str(local_bg_path)
+    final_png_str = str(final_png)
+
+    print(f"🔥 Step4[{tag}]: 카드뉴스 오버레이 생성 중...")
 
     # ===== compose_cardnews에 필요한 layout_config 구성 =====
     layout_config = {
@@ -123,32 +196,88 @@ def run_test():
     }
 
     compose_cardnews(
-        background_path=str(local_bg_path),
-        output_path=str(final_png),
+        background_path=bg_path_str,
+        output_path=final_png_str,
         layout_config=layout_config,
-        fonts_dir=str(FONTS_BASE)
+        fonts_dir=FONTS_DIR_STR
     )
-    print("✓ 최종 이미지 생성 완료:", final_png)
+    print(f"✓ 최종 이미지 생성 완료[{tag}]:", final_png)
 
-    print("🔥 Step4: JSON 기록 중...")
-    result_json.write_text(
-        json.dumps(
+    result_json.write_bytes(
+        dump_json_bytes(
             {
                 "visual_prompt": vp,
                 "style_name": style,
                 "background_url": bg_url,
-                "background_local_path": str(local_bg_path),
-                "output_image": str(final_png)
-            },
-            ensure_ascii=False,
-            indent=2
+                "background_local_path": bg_path_str,
+                "output_image": final_png_str
+            }
+        )
+    )
+    print(f"✓ JSON 저장 완료[{tag}]:", result_json)
+    return final_png
+
+
+# ====== 실제 테스트 수행 ======
+async def run_test(num_runs: int = 1):
+    """
+    Replicate 생성(URL) → 로컬 다운로드 → 오버레이를 단계별 작업으로 나눠 파이프라인 실행
+    - 단계 사이에 Queue(maxsize=2)를 둬서, 느린 단계가 앞 단계를 자연스럽게 멈추게 함
+    - num_runs > 1 이면 다음 Replicate 호출이 이전 결과의 다운로드/합성과 겹쳐서 돈다
+    """
+    loop = asyncio.get_running_loop()
+
+    print("🔥 Step1: 프롬프트 생성 중...")
+    prompt_data = await loop.run_in_executor(
+        None,
+        lambda: build_prompt_for_review(
+            references=TEST_REFERENCES,
+            user_theme="봄 감성 + 가족 중심",
+            keywords=["벚꽃", "가족", "음악"]
         ),
-        encoding="utf-8"
     )
-    print("✓ JSON 저장 완료:", result_json)
+    vp = prompt_data["visual_prompt"]
+    style = prompt_data["style_name"]
+    print("✓ 프롬프트 생성 완료")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    url_q: asyncio.Queue = asyncio.Queue(maxsize=2)
+    local_q: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+    async def generate_stage():
+        try:
+            for n in range(num_runs):
+                tag = timestamp if num_runs == 1 else f"{timestamp}_{n}"
+                print(f"🔥 Step2[{tag}]: 배경 이미지 생성 중...")
+                bg_url = await loop.run_in_executor(None, generate_image_from_prompt, vp)
+                print(f"✓ Replicate 이미지 생성 완료[{tag}]:", bg_url)
+                await url_q.put((tag, bg_url))
+        finally:
+            await url_q.put(None)
+
+    async def download_stage():
+        try:
+            while (item := await url_q.get()) is not None:
+                tag, bg_url = item
+                # ===== URL → 로컬로 다운로드 =====
+                print(f"🔥 Step3[{tag}]: 배경 이미지 다운로드 중...")
+                local_bg_path = OUTPUT_DIR / f"background_{tag}.png"
+                await loop.run_in_executor(None, download_image_to_local, bg_url, local_bg_path)
+                await local_q.put((tag, bg_url, local_bg_path))
+        finally:
+            await local_q.put(None)
+
+    async def compose_stage():
+        while (item := await local_q.get()) is not None:
+            tag, bg_url, local_bg_path = item
+            await loop.run_in_executor(
+                None, compose_and_record, vp, style, bg_url, local_bg_path, tag
+            )
+
+    await asyncio.gather(generate_stage(), download_stage(), compose_stage())
 
     print("\n🎉 ALL DONE — 테스트 성공!\n")
 
 
 if __name__ == "__main__":
-    run_test()
+    asyncio.run(run_test())
@@ -1,13 +1,55 @@
+import argparse
 import asyncio
+import importlib.util
 import json
+import os
 import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+import httpx
 
 from app.tools.cardnews.festival_loader import load_festivals
 from app.tools.cardnews.image_loader import download_cardnews_images
 from app.service.cardnews.cardnews_score_service import hybrid_cardnews_score
 
+# orjson 이 있으면 UTF-8 바이트로 바로 직렬화 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json_bytes(obj) -> bytes:
+    """indent=2, 한글 그대로(ensure_ascii=False) JSON 을 UTF-8 바이트로"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 카테고리 수집(인스타/이미지 다운로드) 동시 실행 개수 / 점수화 스레드 개수
+# - 인스타 쪽 차단을 피하려고 동시 요청 수는 환경변수로 낮게 제한
+CATEGORY_CONCURRENCY = int(os.getenv("CARDNEWS_CONCURRENCY", "6"))
+DOWNLOADS_PER_CATEGORY = int(os.getenv("CARDNEWS_DOWNLOADS_PER_CATEGORY", "4"))
+SCORE_WORKERS = 4
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """
+    배치 전체에서 공유할 AsyncClient (SerpApi 검색 + 이미지 다운로드)
+    - 축제/카테고리마다 TCP/TLS 핸드셰이크를 새로 하지 않도록 keep-alive 풀 재사용
+    - h2 패키지가 있으면 HTTP/2 사용
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=20.0,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+@lru_cache(maxsize=1)
 def resolve_paths():
     """
     📁 현재 파일 위치 기준으로 ACC/data 경로 계산
@@ -29,7 +71,76 @@ def resolve_paths():
     return csv_path, results_dir, data_root
 
 
-async def run_batch_test():
+async def _score_records(records: list[dict], executor: ThreadPoolExecutor) -> list[dict]:
+    """
+    수집된 레코드를 스레드풀에서 점수화 (자동 배치 모드 → text_prompt=None)
+    - hybrid_cardnews_score 는 동기 함수라 이벤트 루프를 막지 않도록 executor 로 넘김
+    """
+    loop = asyncio.get_running_loop()
+    futures = [
+        loop.run_in_executor(executor, hybrid_cardnews_score, rec["file_path"], None)
+        for rec in records
+    ]
+    scores = await asyncio.gather(*futures, return_exceptions=True)
+
+    scored_items = []
+    for rec, score in zip(records, scores):
+        if isinstance(score, Exception):
+            scored_items.append({**rec, "error": str(score)})
+        else:
+            scored_items.append({**rec, "score": score.model_dump(mode="json")})
+    return scored_items
+
+
+async def _collect_category(
+    cat: str,
+    name: str,
+    region: str,
+    year: int,
+    limit_images: int,
+    sem: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    client: httpx.AsyncClient,
+) -> dict:
+    """
+    카테고리 1개: 인스타 카드뉴스 썸네일 수집 → 점수화
+    - 다운로드는 세마포어로 동시 개수 제한
+    - 점수화는 세마포어 밖에서 돌려서, 다른 카테고리 다운로드와 겹치게 함
+    """
+    print(f"   🔎 카테고리 [{cat}] 수집 중...")
+
+    query = f"{name} 카드뉴스 {cat} site:instagram.com"
+
+    # 5-1. 인스타 카드뉴스 썸네일 수집
+    async with sem:
+        records = await download_cardnews_images(
+            category=cat,
+            query=query,
+            festival_name=name,
+            region=region,
+            year=year,
+            limit_images=limit_images,
+            client=client,
+            concurrent_downloads=DOWNLOADS_PER_CATEGORY,
+        )
+
+    # 5-2. 점수화
+    scored_items = await _score_records(records, executor)
+
+    print(f"   ✅ [{cat}] 완료 (이미지 {len(records)}개)")
+    return {
+        "category": cat,
+        "images": scored_items,
+    }
+
+
+async def run_batch_test(
+    num_festivals: int | None = None,
+    limit_images: int | None = None,
+    concurrency: int | None = None,
+    seed: int | None = None,
+    out: str | None = None,
+):
     """
     🎯 테스트용 카드뉴스 배치 실행
     - CSV에서 축제 리스트 로드
@@ -37,6 +148,8 @@ async def run_batch_test():
     - 각 축제에 대해 [부스소개, 지도, 축제개요, 행사일정] 카테고리별로
       인스타 카드뉴스 썸네일 수집 + 점수화
     - 최종 결과를 JSON 파일로 저장
+
+    인자를 안 넘기면 터미널에서 입력받는다 (CLI 인자: --num-festivals 등, 하단 main 참고)
     """
 
     csv_path, results_dir, data_root = resolve_paths()
@@ -48,9 +161,14 @@ async def run_batch_test():
     print(f"📄 CSV 경로: {csv_path}")
     print(f"📁 데이터 루트: {data_root}")
 
-    # 1️⃣ 입력값 받기 (테스트니까 단순하게)
-    num_festivals = int(input("📦 몇 개의 축제를 랜덤으로 조회할까요?: ").strip())
-    limit_images = int(input("🖼️ 축제별 최대 몇 장의 이미지를 가져올까요?: ").strip())
+    # 1️⃣ 입력값 (인자로 안 들어온 것만 터미널에서 입력받기)
+    if num_festivals is None or limit_images is None:
+        if not sys.stdin.isatty():
+            raise SystemExit("--num-festivals / --limit-images 를 지정하세요 (비대화형 실행)")
+    if num_festivals is None:
+        num_festivals = int(input("📦 몇 개의 축제를 랜덤으로 조회할까요?: ").strip())
+    if limit_images is None:
+        limit_images = int(input("🖼️ 축제별 최대 몇 장의 이미지를 가져올까요?: ").strip())
 
     # 2️⃣ CSV → 축제 리스트 로드
     festivals = load_festivals(str(csv_path))
@@ -63,7 +181,8 @@ async def run_batch_test():
         print(f"요청한 개수({num_festivals})가 축제 수({len(festivals)})보다 많아 전체 축제 사용합니다.")
         num_festivals = len(festivals)
 
-    target_list = random.sample(festivals, num_festivals)
+    # seed를 주면 같은 축제 조합을 재현할 수 있음
+    target_list = random.Random(seed).sample(festivals, num_festivals)
 
     print(f"\n[INFO] 총 {len(festivals)}개 중에서 {num_festivals}개 축제를 랜덤 선택했습니다.\n")
 
@@ -75,79 +194,90 @@ async def run_batch_test():
         cat_dir = data_root / cat
         cat_dir.mkdir(parents=True, exist_ok=True)
 
-    all_results = []
-
-    # 5️⃣ 축제별 수집 + 점수화
-    for f in target_list:
-        name = f.get("festival_name")
-        region = f.get("region", "")
-        year = f.get("year", 2025)
-
-        print(f"📡 [축제] {region} - {name} ({year}) 처리 시작...")
-
-        festival_result = {
-            "festival_name": name,
-            "region": region,
-            "year": year,
-            "categories": []
-        }
-
-        for cat in categories:
-            print(f"   🔎 카테고리 [{cat}] 수집 중...")
-
-            query = f"{name} 카드뉴스 {cat} site:instagram.com"
-
-            # 5-1. 인스타 카드뉴스 썸네일 수집
-            records = await download_cardnews_images(
-                category=cat,
-                query=query,
-                festival_name=name,
-                region=region,
-                year=year,
-                limit_images=limit_images,
-            )
-
-            scored_items = []
-            for rec in records:
-                try:
-                    # 5-2. 점수화 (자동 배치 모드 → text_prompt=None)
-                    score = hybrid_cardnews_score(
-                        image_path=rec["file_path"],
-                        text_prompt=None,  # 기획의도 없이 트렌드 참조용 수집
+    sem = asyncio.Semaphore(concurrency or CATEGORY_CONCURRENCY)
+    executor = ThreadPoolExecutor(max_workers=SCORE_WORKERS)
+    client = _new_http_client()
+
+    # 6️⃣ 결과 JSON (→ Spring Boot에서 읽어서 DB에 넣을 대상)
+    #    배열 괄호만 먼저/나중에 쓰고, 축제별 결과는 끝나는 대로 이어서 기록
+    if out:
+        out_path = Path(out)
+    else:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        out_path = results_dir / f"cardnews_batch_random_{ts}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(out_path, "wb") as fp:
+        fp.write(b"[\n")
+        try:
+            # 5️⃣ 축제별 수집 + 점수화 (카테고리는 동시에 처리)
+            for idx, f in enumerate(target_list):
+                name = f.get("festival_name")
+                region = f.get("region", "")
+                year = f.get("year", 2025)
+
+                print(f"📡 [축제] {region} - {name} ({year}) 처리 시작...")
+
+                festival_result = {
+                    "festival_name": name,
+                    "region": region,
+                    "year": year,
+                    "categories": []
+                }
+
+                tasks = [
+                    asyncio.create_task(
+                        _collect_category(
+                            cat, name, region, year, limit_images, sem, executor, client
+                        )
                     )
-                    scored_items.append({
-                        **rec,
-                        "score": score.model_dump(mode="json"),
-                    })
-                except Exception as e:
-                    scored_items.append({
-                        **rec,
-                        "error": str(e),
-                    })
-
-            festival_result["categories"].append({
-                "category": cat,
-                "images": scored_items,
-            })
-
-            print(f"   ✅ [{cat}] 완료 (이미지 {len(records)}개)")
-
-        all_results.append(festival_result)
-        print(f"✅ [축제 완료] {name}\n")
-
-    # 6️⃣ 최종 JSON 저장 (→ Spring Boot에서 읽어서 DB에 넣을 대상)
-    results_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    out_path = results_dir / f"cardnews_batch_random_{ts}.json"
-
-    out_path.write_text(
-        json.dumps(all_results, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+                    for cat in categories
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                for cat, res in zip(categories, results):
+                    if isinstance(res, Exception):
+                        print(f"   ❌ [{cat}] 수집 실패: {res}")
+                        festival_result["categories"].append({
+                            "category": cat,
+                            "images": [],
+                            "error": str(res),
+                        })
+                    else:
+                        festival_result["categories"].append(res)
+
+                # 축제 1개가 끝날 때마다 바로 파일에 기록 (전체 결과를 메모리에 모으지 않음)
+                if idx > 0:
+                    fp.write(b",\n")
+                fp.write(dump_json_bytes(festival_result))
+                fp.flush()
+                print(f"✅ [축제 완료] {name}\n")
+        finally:
+            # 중간에 실패해도 그때까지의 결과는 유효한 JSON 배열로 남김
+            fp.write(b"\n]\n")
+            executor.shutdown(wait=False)
+            await client.aclose()
 
     print("📁 최종 결과 JSON 저장 완료")
     print(f"➡ 경로: {out_path.absolute()}")
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="카드뉴스 배치 수집 + 점수화 테스트")
+    parser.add_argument("--num-festivals", type=int, help="랜덤으로 조회할 축제 수")
+    parser.add_argument("--limit-images", type=int, help="카테고리별 최대 이미지 수")
+    parser.add_argument("--concurrency", type=int, help=f"동시 수집 카테고리 수 (기본 {CATEGORY_CONCURRENCY})")
+    parser.add_argument("--seed", type=int, help="축제 랜덤 선택 seed (재현용)")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: data/cardnews_results/cardnews_batch_random_{ts}.json)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    asyncio.run(run_batch_test())
+    args = parse_args()
+    asyncio.run(run_batch_test(
+        num_festivals=args.num_festivals,
+        limit_images=args.limit_images,
+        concurrency=args.concurrency,
+        seed=args.seed,
+        out=args.out,
+    ))
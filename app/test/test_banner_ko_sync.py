@@ -10,18 +10,26 @@ test_banner_ko_sync.py
 > python app/test/test_banner_ko_sync.py
 """
 
-import os, sys, json
+import os, sys, json, re
 from pathlib import Path
 
 # ---------------- sys.path 루트 주입 ----------------
+# 한 번 찾은 루트는 ACC_PROJECT_ROOT 에 남겨서 같은 프로세스/자식 프로세스에서 재탐색 생략
+# (다른 체크아웃에서 물려받은 값일 수 있으니 app 폴더가 있을 때만 사용)
 HERE = Path(__file__).resolve()
-for p in [HERE.parent] + list(HERE.parents):
-    if (p / "app").is_dir():
-        sys.path.insert(0, str(p))
-        PROJECT_ROOT = p
-        break
+_env_root = os.getenv("ACC_PROJECT_ROOT")
+if _env_root and (Path(_env_root) / "app").is_dir():
+    PROJECT_ROOT = Path(_env_root)
 else:
-    print("[ERROR] 프로젝트 루트를 찾지 못했습니다."); sys.exit(1)
+    for p in [HERE.parent] + list(HERE.parents):
+        if (p / "app").is_dir():
+            PROJECT_ROOT = p
+            os.environ["ACC_PROJECT_ROOT"] = str(p)
+            break
+    else:
+        print("[ERROR] 프로젝트 루트를 찾지 못했습니다."); sys.exit(1)
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 # ---------------- .env 로드 ----------------
 try:
@@ -70,18 +78,23 @@ analysis_payload = {
     }
 }
 
+# job 에 넘길 키 (없어도 되는 KO 키는 "" 기본값)
+JOB_KEYS = ("prompt", "width", "height", "aspect_ratio", "resolution", "use_pre_llm")  # "seed"
+JOB_OPTIONAL_KEYS = ("prompt_ko", "prompt_ko_baseline")  # KO (수정 가능) / KO 기준선
+
+# KO 프롬프트 수정 케이스: 치환 목록을 한 번에 처리하는 정규식
+KO_EDITS = {
+    "따뜻한 빨강과 초록": "따뜻한 골드와 화이트",
+    "포토존": "체험형 라이트 가든",
+}
+KO_EDIT_RE = re.compile("|".join(map(re.escape, KO_EDITS)))
+
+
 def to_job(prompt_obj: dict) -> dict:
-    return {
-        "prompt":         prompt_obj["prompt"],            # EN
-        "prompt_ko":      prompt_obj.get("prompt_ko", ""), # KO (수정 가능)
-        "prompt_ko_baseline": prompt_obj.get("prompt_ko_baseline", ""),  # KO 기준선
-        "width":          prompt_obj["width"],
-        "height":         prompt_obj["height"],
-        "aspect_ratio":   prompt_obj["aspect_ratio"],
-        "resolution":     prompt_obj["resolution"],
-        "use_pre_llm":    prompt_obj["use_pre_llm"],
-        # "seed":         prompt_obj.get("seed"),
-    }
+    job = {k: prompt_obj[k] for k in JOB_KEYS}
+    for k in JOB_OPTIONAL_KEYS:
+        job[k] = prompt_obj.get(k, "")
+    return job
 
 def run_case(orientation: str, modify_ko: bool, prefix: str):
     print(f"===== CASE: orientation={orientation}, modify_ko={modify_ko} =====")
@@ -102,8 +115,7 @@ def run_case(orientation: str, modify_ko: bool, prefix: str):
 
     # 3) KO 프롬프트 수정(옵션) → EN 자동 동기화 기대
     if modify_ko and job["prompt_ko"]:
-        job["prompt_ko"] = job["prompt_ko"].replace("따뜻한 빨강과 초록", "따뜻한 골드와 화이트") \
-                                           .replace("포토존", "체험형 라이트 가든")
+        job["prompt_ko"] = KO_EDIT_RE.sub(lambda m: KO_EDITS[m.group(0)], job["prompt_ko"])
         print("[INFO] KO prompt modified.\n")
 
     # 4) 배너 생성 (ko_sync=True, artifact_paths 포함 dict 반환)
@@ -22,13 +22,22 @@ SAVE_TO_FILE = True   # 콘솔 출력 + 파일 저장
 OUT_DIR = Path("out") / "test_prompts"
 
 # --- 루트 자동 탐색 후 sys.path 추가 (파일 경로 실행 지원) ---
+# 한 번 찾은 루트는 ACC_PROJECT_ROOT 에 남겨서 재탐색 생략
+# (다른 체크아웃에서 물려받은 값일 수 있으니 app 폴더가 있을 때만 사용)
 def _ensure_project_root_on_sys_path():
-    here = Path(__file__).resolve()
-    for parent in [here.parent] + list(here.parents):
-        if (parent / "app").is_dir():
-            sys.path.insert(0, str(parent))
-            return str(parent)
-    raise SystemExit("❌ 프로젝트 루트를 찾지 못했습니다. 'app' 폴더 경로를 확인하세요.")
+    root = os.getenv("ACC_PROJECT_ROOT")
+    if not root or not (Path(root) / "app").is_dir():
+        here = Path(__file__).resolve()
+        for parent in [here.parent] + list(here.parents):
+            if (parent / "app").is_dir():
+                root = str(parent)
+                os.environ["ACC_PROJECT_ROOT"] = root
+                break
+        else:
+            raise SystemExit("❌ 프로젝트 루트를 찾지 못했습니다. 'app' 폴더 경로를 확인하세요.")
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    return root
 
 ROOT = _ensure_project_root_on_sys_path()
 
@@ -8,10 +8,13 @@ trend_tools.py
 .env:
   OPENAI_API_KEY=sk-...
   (옵션) OPENAI_TREND_MODEL=gpt-4o-mini
+  (옵션) TREND_CACHE_DIR=...   # 동일 입력 재호출 시 LLM 생략 (기본: app/data/.trend_cache)
 """
 
-import os, json, re
+import os, json, re, hashlib
 from datetime import datetime
+from itertools import chain
+from pathlib import Path
 
 # .env 로드(있으면)
 try:
@@ -20,27 +23,122 @@ try:
 except Exception:
     pass
 
-# OpenAI SDK (>=1.x)
+# orjson 이 있으면 JSON 파싱에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# OpenAI SDK (>=1.x) — 클라이언트는 실제 호출할 때 처음 생성 (import 시 초기화 비용 없음)
+import httpx
 import openai
-client = openai.OpenAI()
+
+_client = None
+
+
+def _get_client() -> "openai.OpenAI":
+    global _client
+    if _client is None:
+        _client = openai.OpenAI(timeout=httpx.Timeout(30.0, connect=5.0), max_retries=2)
+    return _client
 
 OPENAI_TREND_MODEL = os.getenv("OPENAI_TREND_MODEL", "gpt-4o-mini")
+# 프롬프트에 싣는 분석 JSON 최대 크기(UTF-8 바이트) / 우선 포함할 키
+ANALYSIS_EXCERPT_MAX_BYTES = 6000
+PRIORITY_ANALYSIS_KEYS = ("festival", "analysis")
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.S)
+# 실행 위치(cwd)와 상관없이 app/data 아래에 둔다
+TREND_CACHE_DIR = Path(
+    os.getenv("TREND_CACHE_DIR") or Path(__file__).resolve().parents[2] / "data" / ".trend_cache"
+)
+# 로컬 타임존은 import 시 한 번만 조회 (generated_at 용)
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+
+# ---------- 디스크 캐시: 동일 (모델, 축제, 의도, 키워드, 분석) → 같은 결과 재사용 ----------
+def _trend_cache_key(festival: str, intent: str, keywords: list, analysis_payload: dict) -> str:
+    raw = json.dumps(
+        {
+            "model": OPENAI_TREND_MODEL,
+            "f": festival,
+            "i": intent,
+            "k": list(keywords),  # 순서도 키에 포함 (캐시된 festival.keywords 순서와 일치)
+            "a": analysis_payload,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _trend_cache_get(key: str) -> dict | None:
+    try:
+        return json.loads((TREND_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _trend_cache_set(key: str, obj: dict) -> None:
+    try:
+        TREND_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = TREND_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, TREND_CACHE_DIR / f"{key}.json")  # 동시 실행 시에도 반쯤 쓴 파일이 안 보이게
+    except OSError as e:
+        print(f"[trend_tools] 캐시 저장 실패(무시): {e}")
+
+
+def _loads(text: str):
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def _json_guard(text: str) -> dict:
     """모델이 JSON만 내도록 요청하지만, 혹시 앞뒤 문장이 섞이면 중괄호 블록만 파싱."""
     try:
-        return json.loads(text)
+        return _loads(text)
     except Exception:
-        m = re.search(r"\{.*\}", text, re.S)
+        m = _JSON_BLOCK_RE.search(text)
         if not m:
             raise ValueError("LLM 응답에서 JSON을 찾을 수 없습니다.")
-        return json.loads(m.group(0))
+        return _loads(m.group(0))
+
+
+def _dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _analysis_excerpt(analysis_payload, max_bytes: int = ANALYSIS_EXCERPT_MAX_BYTES) -> str:
+    """
+    analysis가 길 수 있어 UTF-8 바이트 기준으로 잘라서 사용.
+    - dict면 festival → analysis → 나머지 키 순서로, 통째로 들어가는 키만 담음(값 중간에서 안 잘림)
+    - 하나도 안 들어가면 직렬화 결과를 바이트 단위로 자름
+    """
+    if isinstance(analysis_payload, dict):
+        priority = [k for k in PRIORITY_ANALYSIS_KEYS if k in analysis_payload]
+        ordered = priority + [k for k in analysis_payload if k not in PRIORITY_ANALYSIS_KEYS]
+
+        picked, used = {}, 2  # "{}"
+        for k in ordered:
+            size = len(_dumps_bytes({k: analysis_payload[k]})) - 1  # 키:값 + 구분자
+            if used + size > max_bytes:
+                continue
+            picked[k] = analysis_payload[k]
+            used += size
+        if picked:
+            return _dumps_bytes(picked).decode("utf-8")
+
+    return _dumps_bytes(analysis_payload)[:max_bytes].decode("utf-8", errors="ignore")
 
 
 def _mk_messages(festival: str, intent: str, keywords: list, analysis_payload: dict):
-    # analysis가 길 수 있어 앞부분만 사용
-    analysis_excerpt = json.dumps(analysis_payload, ensure_ascii=False)[:6000]
+    analysis_excerpt = _analysis_excerpt(analysis_payload)
 
     system = (
         "You are a senior OOH/banner art director. "
@@ -123,32 +221,18 @@ def _render_paste_md(obj: dict) -> str:
     intent = f.get("intent", "-")
     keywords = ", ".join(f.get("keywords", [])) or "-"
 
-    # 집계
-    vis, copies, colors, layouts, pitfalls = [], [], [], [], []
-    for r in obj.get("reference_patterns", []):
-        h = r.get("how_others_do", {})
-        vis += h.get("visual_motifs", []) or []
-        copies += h.get("copy_patterns", []) or []
-        colors += h.get("color_directions", []) or []
-        layouts += h.get("layout_habits", []) or []
-        pitfalls += h.get("pitfalls", []) or []
-
-    # 중복 제거, 앞쪽 3~4개만
-    def uniq_take(seq, n): 
-        out, seen = [], set()
-        for x in seq:
-            if x in seen: 
-                continue
-            seen.add(x); out.append(x)
-            if len(out) >= n: 
-                break
-        return out
+    # 집계 + 중복 제거(순서 유지), 앞쪽 3~4개만
+    patterns = [r.get("how_others_do", {}) for r in obj.get("reference_patterns", [])]
+
+    def uniq_take(key, n):
+        seq = chain.from_iterable(h.get(key, []) or [] for h in patterns)
+        return list(dict.fromkeys(seq))[:n]
 
-    vis = uniq_take(vis, 4)
-    copies = uniq_take(copies, 3)
-    colors = uniq_take(colors, 3)
-    layouts = uniq_take(layouts, 3)
-    pitfalls = uniq_take(pitfalls, 3)
+    vis = uniq_take("visual_motifs", 4)
+    copies = uniq_take("copy_patterns", 3)
+    colors = uniq_take("color_directions", 3)
+    layouts = uniq_take("layout_habits", 3)
+    pitfalls = uniq_take("pitfalls", 3)
 
     # 추천안 선택
     recs = obj.get("recommendations", {}) or {}
@@ -193,34 +277,83 @@ def _render_paste_md(obj: dict) -> str:
     return "\n".join(lines).strip()
 
 
+def _stream_trend_content(messages: list) -> str:
+    """
+    응답을 stream=True 로 받아 누적하다가, 최상위 JSON 객체의 닫는 중괄호가 오면 바로 끊고 반환.
+    (문자열 안의 중괄호/이스케이프는 무시하고 깊이를 센다)
+    """
+    stream = _get_client().chat.completions.create(
+        model=OPENAI_TREND_MODEL,
+        messages=messages,
+        temperature=0.4,
+        top_p=0.9,
+        response_format={"type": "json_object"},
+        stream=True,
+    )
+
+    parts: list[str] = []
+    depth, in_str, escape, started = 0, False, False, False
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+
+            for ch in delta:
+                if in_str:
+                    if escape:
+                        escape = False
+                    elif ch == "\\":
+                        escape = True
+                    elif ch == '"':
+                        in_str = False
+                elif ch == '"':
+                    in_str = True
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}":
+                    depth -= 1
+            if started and depth == 0:
+                break  # 객체 완성 → 남은 토큰(공백 등) 기다리지 않음
+    finally:
+        stream.close()
+
+    return "".join(parts)
+
+
 def generate_trend(festival: str, intent: str, keywords: list, analysis_payload: dict) -> dict:
     """
     반환: LLM이 생성한 트렌드 분석 dict (실패 시 {'error': '...'} 형식)
           + obj['paste_md'] 보장(미제공 시 fallback 렌더링)
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return {"error": "OPENAI_API_KEY가 설정되어 있지 않습니다(.env)."}
-
     try:
-        resp = client.chat.completions.create(
-            model=OPENAI_TREND_MODEL,
-            messages=_mk_messages(festival, intent, keywords, analysis_payload),
-            temperature=0.4,
-            top_p=0.9,
-            response_format={"type": "json_object"},
-        )
-        content = resp.choices[0].message.content
+        # 직렬화할 수 없는 analysis_payload 도 예외 대신 {'error': ...} 로 돌려주도록 try 안에서 계산
+        cache_key = _trend_cache_key(festival, intent, keywords, analysis_payload)
+        cached = _trend_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return {"error": "OPENAI_API_KEY가 설정되어 있지 않습니다(.env)."}
+
+        content = _stream_trend_content(_mk_messages(festival, intent, keywords, analysis_payload))
         obj = _json_guard(content)
 
         # 필수 메타 보정
         obj.setdefault("schema_version", "1.0")
         obj.setdefault("festival", {"name": festival, "intent": intent, "keywords": keywords})
-        obj.setdefault("generated_at", datetime.now().astimezone().isoformat())
+        obj.setdefault("generated_at", datetime.now(_LOCAL_TZ).isoformat())
 
         # 붙여넣기용 md가 없으면 생성
         if not obj.get("paste_md"):
             obj["paste_md"] = _render_paste_md(obj)
+
+        _trend_cache_set(cache_key, obj)
         return obj
 
     except Exception as e:
@@ -1,54 +1,228 @@
+import heapq
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import pandas as pd
 import datetime
 
+# pyarrow 가 있으면 멀티스레드 CSV 파서 사용 (없으면 pandas 청크 파싱)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = pc = pacsv = None
+
+class FestivalList(list):
+    """
+    load_festivals 반환 타입: 일반 list + region_index(지역 문자열 → 행 번호 목록)
+    - filter_festivals_by_region 이 전체 행 대신 지역 키(수십 개)만 훑도록 하기 위한 인덱스
+    - 리스트에 행을 넣거나 빼면 인덱스는 갱신되지 않음 (행 dict 수정은 괜찮음)
+    """
+    region_index: Dict[str, List[int]]
+
+# === 컬럼 매핑 (소문자 키로 미리 변환) ===
+_RENAME_MAP = {k.lower(): v for k, v in {
+    "기초자치단체명": "city",
+    "축제 유형": "type",
+    "시작일": "start_date",
+    "종료일": "end_date",
+    "연번": "no"
+}.items()}
+_KEEP_COLUMNS = {"festival_name", "region", *_RENAME_MAP.values()}
+_STRING_COLUMNS = {"festival_name", "region", "city", "type", "start_date", "end_date"}
+
+# 한 번에 파싱할 행 수 (큰 CSV도 이 크기만큼만 메모리에 올림)
+CSV_CHUNK_ROWS = 100_000
+
+# pyarrow 경로: 이 크기 이상인 CSV는 줄 경계로 나눠 여러 프로세스에서 파싱
+# (셀 안에 줄바꿈이 있는 CSV는 조각 경계가 어긋나므로 대상 아님 — 축제 CSV는 한 줄 = 한 행)
+LARGE_CSV_BYTES = 256 * 1024 * 1024
+LARGE_CSV_MAX_WORKERS = 8
+
 def load_festivals(csv_path: str) -> List[Dict]:
     """
     📄 CSV에서 축제 데이터 로드 (현재 CSV 구조 전용)
     ─────────────────────────────────────────────
     CSV 예시:
     연번 | region | 기초자치단체명 | festival_name | 축제 유형 | 시작일 | 종료일
-    """
 
+    - (경로, 수정시각, 크기)가 같으면 이전 파싱 결과 재사용 → CSV를 고치면 자동으로 다시 읽음
+    - 반환되는 dict는 호출마다 얕은 복사본이라 필드를 추가/수정해도 캐시에 영향 없음
+    """
     p = Path(csv_path)
-    if not p.exists():
-        raise FileNotFoundError(f"CSV not found: {csv_path}")
-
-    df = pd.read_csv(p)
-    df.columns = [c.strip().lower() for c in df.columns]  # 소문자 변환
-
-    # === 컬럼 매핑 ===
-    rename_map = {
-        "기초자치단체명": "city",
-        "축제 유형": "type",
-        "시작일": "start_date",
-        "종료일": "end_date",
-        "연번": "no"
-    }
-    df.rename(columns={k.lower(): v for k, v in rename_map.items()}, inplace=True)
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV not found: {csv_path}") from None
+
+    records, region_index = _load_cached(str(p.resolve()), st.st_mtime_ns, st.st_size)
+    festivals = FestivalList(dict(r) for r in records)
+    festivals.region_index = region_index
+    return festivals
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[Dict, ...], Dict[str, List[int]]]:
+    records = tuple(_parse_festivals(Path(path)))
+    region_index: Dict[str, List[int]] = {}
+    for i, f in enumerate(records):
+        # region 은 여기서 한 번만 문자열로 맞춰 두고, 필터에서는 변환 없이 사용
+        f["region"] = region = str(f.get("region", "") or "")
+        region_index.setdefault(region, []).append(i)
+    return records, region_index
+
+def _parse_festivals(p: Path) -> List[Dict]:
+    """
+    - 헤더만 먼저 읽어서 필요한 컬럼만(usecols) 문자열로(dtype) 파싱
+    - CSV_CHUNK_ROWS 단위로 나눠 읽고, 청크마다 이름 변환/연도 계산/결측 제거 후 레코드로 누적
+    - pandas / pyarrow 어느 경로든 레코드 모양은 같다: year 는 int 또는 None, 빈 값은 None
+    """
+    # === 헤더 확인: 원본 컬럼명 → 소문자/매핑된 이름 ===
+    header = pd.read_csv(p, nrows=0).columns
+    names = {}
+    for c in header:
+        name = str(c).strip().lower()  # 소문자 변환
+        names[c] = _RENAME_MAP.get(name, name)
+    usecols = [c for c in header if names[c] in _KEEP_COLUMNS]
 
     # === 필수 컬럼 존재 여부 확인 ===
     required = {"festival_name", "region"}
-    missing = required - set(df.columns)
+    missing = required - set(names.values())
     if missing:
         raise ValueError(f"CSV missing columns: {missing}")
 
+    has_start_date = "start_date" in names.values()
+    this_year = datetime.datetime.now().year
+    str_cols = [c for c in usecols if names[c] in _STRING_COLUMNS]
+
+    if pacsv is not None:
+        return _load_with_arrow(p, usecols, str_cols, names, has_start_date, this_year)
+
+    records: List[Dict] = []
+    chunks = pd.read_csv(
+        p,
+        usecols=usecols,
+        dtype={c: str for c in str_cols},
+        chunksize=CSV_CHUNK_ROWS,
+    )
+    for chunk in chunks:
+        chunk = chunk.rename(columns=names)
+
+        # === year 컬럼 자동 생성 (시작일 기준 or 현재년도) ===
+        if has_start_date:
+            try:
+                chunk["year"] = pd.to_datetime(chunk["start_date"], errors="coerce", cache=True).dt.year
+            except Exception:
+                chunk["year"] = this_year
+        else:
+            chunk["year"] = this_year
+
+        # === 불필요한 결측 제거 ===
+        chunk = chunk.dropna(subset=["festival_name", "region"])
+
+        # === pyarrow 경로와 같은 모양으로: 정수 컬럼(year, no)은 int, 결측은 NaN 대신 None ===
+        chunk = chunk.convert_dtypes(convert_string=False, convert_boolean=False)
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+
+        records.extend(chunk.to_dict(orient="records"))
+
+    return records
+
+def _load_with_arrow(
+    p: Path,
+    usecols: List[str],
+    str_cols: List[str],
+    names: Dict[str, str],
+    has_start_date: bool,
+    this_year: int,
+) -> List[Dict]:
+    """pyarrow 로 CSV 전체를 컬럼 버퍼로 파싱 → 이름 변환/연도/결측 제거 → dict 리스트"""
+    if p.stat().st_size >= LARGE_CSV_BYTES:
+        table = _read_csv_parallel(p, usecols, str_cols)
+    else:
+        table = pacsv.read_csv(
+            p,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=_arrow_convert_options(usecols, str_cols),
+        )
+    table = table.rename_columns([names[c] for c in table.column_names])
+
+    # === 불필요한 결측 제거 (먼저 걸러서 날짜 파싱할 행 수를 줄임) ===
+    table = table.filter(pc.and_(pc.is_valid(table["festival_name"]), pc.is_valid(table["region"])))
+
     # === year 컬럼 자동 생성 (시작일 기준 or 현재년도) ===
-    if "start_date" in df.columns:
-        try:
-            df["year"] = pd.to_datetime(df["start_date"], errors="coerce").dt.year
-        except Exception:
-            df["year"] = datetime.datetime.now().year
+    if has_start_date:
+        start = table["start_date"]
+        year = pc.year(pc.strptime(start, format="%Y-%m-%d", unit="s", error_is_null=True))
+        if year.null_count > start.null_count:
+            # YYYY-MM-DD 가 아닌 날짜가 섞여 있으면 pandas 로 관대하게 파싱 (실패 값은 null)
+            parsed = pd.to_datetime(start.to_pandas(), errors="coerce", cache=True)
+            year = pa.array(parsed.dt.year, from_pandas=True).cast(pa.int64())
     else:
-        df["year"] = datetime.datetime.now().year
+        year = pa.array([this_year] * table.num_rows, type=pa.int64())
+    table = table.append_column("year", year)
+
+    return table.to_pylist()
+
+def _arrow_convert_options(usecols: List[str], str_cols: List[str]):
+    return pacsv.ConvertOptions(
+        include_columns=usecols,
+        column_types={c: pa.string() for c in str_cols},
+        strings_can_be_null=True,
+    )
+
+def _read_csv_parallel(p: Path, usecols: List[str], str_cols: List[str]):
+    """
+    큰 CSV: mmap 으로 파일을 열어 헤더 뒤 본문을 줄 경계 기준 N개 바이트 구간으로 나누고,
+    구간마다 별도 프로세스에서 (헤더 + 구간) 을 파싱한 뒤 테이블을 이어 붙인다.
+    """
+    workers = max(1, min(os.cpu_count() or 1, LARGE_CSV_MAX_WORKERS))
+    with open(p, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        header_end = mm.find(b"\n") + 1
+        bounds = [header_end]
+        for k in range(1, workers):
+            nl = mm.find(b"\n", header_end + (size - header_end) * k // workers)
+            bounds.append(size if nl == -1 else nl + 1)
+        bounds.append(size)
 
-    # === 불필요한 결측 제거 ===
-    df = df.dropna(subset=["festival_name", "region"])
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    if not ranges:
+        return pacsv.read_csv(p, convert_options=_arrow_convert_options(usecols, str_cols))
 
-    return df.to_dict(orient="records")
+    args = [(str(p), header_end, start, end, usecols, str_cols) for start, end in ranges]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        tables = list(ex.map(_parse_csv_slice, args))
+    # 조각마다 타입 추론 결과가 다를 수 있는 컬럼(예: 빈 값만 있는 연번)은 넓은 타입으로 맞춤
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+def _parse_csv_slice(args) -> "pa.Table":
+    """워커 프로세스: 헤더 + [start, end) 바이트 구간만 파싱"""
+    path, header_end, start, end, usecols, str_cols = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[:header_end] + mm[start:end]
+    return pacsv.read_csv(
+        pa.BufferReader(data),
+        convert_options=_arrow_convert_options(usecols, str_cols),
+    )
 
 def filter_festivals_by_region(festivals: List[Dict], region: str, limit: int) -> List[Dict]:
     """입력한 지역(region)에 해당하는 상위 n개 축제 반환"""
-    region_filtered = [f for f in festivals if region in str(f.get("region", ""))]
-    return region_filtered[:limit]
+    region_index = getattr(festivals, "region_index", None)
+    if region_index is None:
+        return [f for f in festivals if region in str(f.get("region", "") or "")][:limit]
+
+    # 지역 키만 부분일치 검사 → 해당 행 번호들을 CSV 순서대로 병합
+    matched = [rows for key, rows in region_index.items() if region in key]
+    rows = matched[0] if len(matched) == 1 else heapq.merge(*matched)
+    if isinstance(limit, int) and limit >= 0:
+        rows = islice(rows, limit)  # 필요한 개수만큼만 꺼냄
+        return [festivals[i] for i in rows]
+    return [festivals[i] for i in rows][:limit]
@@ -1,8 +1,11 @@
 import os
 import io
+import asyncio
 import json
+import contextlib
 from pathlib import Path
 from hashlib import sha256
+from itertools import islice
 from datetime import datetime
 from typing import List, Dict
 
@@ -10,7 +13,7 @@ import httpx
 from PIL import Image
 from dotenv import load_dotenv
 
-from .oembed_utils import fetch_oembed_html, extract_slide_images_from_html
+from .oembed_utils import fetch_oembed_html_many, extract_slide_images_from_html
 
 load_dotenv()  # .env 로드
 SERP_API_KEY = os.getenv("SERPAPI_API_KEY")
@@ -20,6 +23,9 @@ ACC_ROOT = Path(__file__).resolve().parents[4]
 
 BASE_DIR = (ACC_ROOT / "data" / "cardnews" / "참조데이터").resolve()
 
+# oEmbed 는 게시물 몇 개씩 묶어서 미리 동시에 조회 (이미지 제한에 걸리면 나머지는 조회 안 함)
+OEMBED_BATCH = 8
+
 # --------------- 유틸 ---------------
 def ensure_dir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
@@ -37,10 +43,11 @@ def save_thumbnail(image_bytes: bytes, save_path: Path, max_w=300):
     img.save(save_path, format="JPEG", quality=70, optimize=True)
 
 # --------------- SerpApi ---------------
-async def fetch_cardnews_images(keyword: str) -> List[Dict]:
+async def fetch_cardnews_images(keyword: str, client: httpx.AsyncClient | None = None) -> List[Dict]:
     """
     SerpApi Google Images로 검색.
     반환: [{thumbnail, link(source), title}, ...]
+    client 를 넘기면 그 커넥션 풀을 재사용 (없으면 호출마다 새로 생성)
     """
     if not SERP_API_KEY:
         raise RuntimeError("SERP_API_KEY not set")
@@ -52,18 +59,41 @@ async def fetch_cardnews_images(keyword: str) -> List[Dict]:
         "hl": "ko",
         "api_key": SERP_API_KEY
     }
-    async with httpx.AsyncClient(timeout=25.0) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
-        out = []
-        for img in data.get("images_results", []):
-            out.append({
-                "thumbnail": img.get("thumbnail"),
-                "source": img.get("link"),
-                "title": img.get("title","")
-            })
-        return out
+    if client is not None:
+        r = await client.get(url, params=params, timeout=25.0)
+    else:
+        async with httpx.AsyncClient(timeout=25.0) as own_client:
+            r = await own_client.get(url, params=params)
+    r.raise_for_status()
+    data = r.json()
+    out = []
+    for img in data.get("images_results", []):
+        out.append({
+            "thumbnail": img.get("thumbnail"),
+            "source": img.get("link"),
+            "title": img.get("title","")
+        })
+    return out
+
+async def _download_slide(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    img_url: str,
+    cat_dir: Path,
+) -> Path | None:
+    """이미지 1장 다운로드 & 썸네일 저장. 실패하면 None"""
+    async with sem:
+        try:
+            resp = await client.get(img_url, follow_redirects=True)
+            if resp.status_code != 200:
+                return None
+            fpath = (cat_dir / safe_filename(img_url)).resolve()
+            # PIL 디코드/리사이즈/인코딩은 스레드에서 (이벤트 루프의 다른 다운로드를 막지 않게)
+            await asyncio.to_thread(save_thumbnail, resp.content, fpath, 300)
+            return fpath
+        except Exception as e:
+            print(f"❌ 이미지 다운로드 실패: {img_url} | {e}")
+            return None
 
 # --------------- 메인 파이프라인 ---------------
 async def download_cardnews_images(
@@ -72,13 +102,18 @@ async def download_cardnews_images(
     festival_name: str,
     region: str,
     year: int,
-    limit_images: int | None = None
+    limit_images: int | None = None,
+    client: httpx.AsyncClient | None = None,
+    concurrent_downloads: int = 1,
 ) -> List[Dict]:
     """
     1) SerpApi로 대표 썸네일 + post_url 확보
     2) oEmbed 가능하면 동일 post의 슬라이드 이미지 전부 확보
     3) 실패시 SerpApi 썸네일 1장만 저장
     4) JSON 메타 저장 (DB 이관 전용)
+
+    client: 배치처럼 여러 번 호출할 때 keep-alive 커넥션을 공유하기 위한 AsyncClient (선택)
+    concurrent_downloads: 한 게시물의 슬라이드 이미지를 동시에 받을 최대 개수 (기본 1 = 순차)
     """
     # 디렉터리 준비
     cat_dir = (BASE_DIR / category).resolve()
@@ -86,69 +121,84 @@ async def download_cardnews_images(
     ensure_dir(cat_dir); ensure_dir(json_dir)
 
     # 1. 검색
-    items = await fetch_cardnews_images(query)
+    items = await fetch_cardnews_images(query, client=client)
 
     # 전체 레코드
     records: List[Dict] = []
     # 이미지 총량 제한 제어
     remaining = limit_images if isinstance(limit_images, int) and limit_images > 0 else None
+    # 생성일은 호출 1번에 한 번만 계산 (레코드끼리 날짜가 어긋나지 않게)
+    create_at = datetime.now().strftime("%Y-%m-%d")
+    # 이미지 동시 다운로드 슬롯
+    dl_sem = asyncio.Semaphore(max(1, concurrent_downloads))
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
+    async with contextlib.AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(httpx.AsyncClient(timeout=20.0))
+
+        htmls: List[str | None] = []
+        batch_start = 0
         for idx, it in enumerate(items):
             post_url = it.get("source")
             title = it.get("title","")
 
-            # 2. oEmbed 시도
+            # 2. oEmbed 시도 (OEMBED_BATCH 개씩 미리 동시에 조회)
+            #    게시물 1개가 최소 1장은 채우므로 남은 허용량보다 많이는 조회하지 않음
+            if idx >= batch_start + len(htmls):
+                batch = OEMBED_BATCH if remaining is None else min(OEMBED_BATCH, remaining)
+                batch_start = idx
+                htmls = await fetch_oembed_html_many(
+                    [x.get("source") for x in items[idx:idx + batch]],
+                    concurrency=batch,
+                    client=client,
+                )
             slide_urls: List[str] = []
-            html = await fetch_oembed_html(post_url)
+            html = htmls[idx - batch_start]
             if html:
                 slide_urls = extract_slide_images_from_html(html)
 
             # 3. 실패시 SerpApi 썸네일 폴백
             candidates = slide_urls if slide_urls else [it.get("thumbnail")]
 
-            for i, img_url in enumerate(candidates):
-                if not img_url:
-                    continue
-                if remaining is not None and remaining <= 0:
+            # 남은 허용량만큼씩 동시에 다운로드하고, 실패한 장 수만큼 다음 슬라이드로 채움
+            # (결과 순서는 슬라이드 순서 유지)
+            targets = iter([(i, img_url) for i, img_url in enumerate(candidates) if img_url])
+            downloaded: List[tuple] = []
+            while remaining is None or len(downloaded) < remaining:
+                want = None if remaining is None else remaining - len(downloaded)
+                batch = list(islice(targets, want))
+                if not batch:
                     break
-
-                # 다운로드 & 썸네일화
-                try:
-                    resp = await client.get(img_url, follow_redirects=True)
-                    if resp.status_code != 200:
-                        continue
-                    fname = safe_filename(img_url)
-                    fpath = (cat_dir / fname).resolve()
-                    save_thumbnail(resp.content, fpath, max_w=300)
-
-                    meta = {
-                        # file_path 테이블 스키마 기반
-                        "file_path_no": None,                         # AUTO_INCREMENT (PK)
-                        "entity_type": "CARDNEWS",                    # NOT NULL
-                        "entity_no": idx,                             # NOT NULL(임시 인덱스)
-                        "file_path": str(fpath),                      # NOT NULL
-                        "source_type": "INSTAGRAM",                   # NOT NULL
-                        "year": int(year),                            # NOT NULL
-                        "region": str(region),                        # NOT NULL
-                        "festival_name": str(festival_name),          # NOT NULL
-                        "file_name": fname,                           # NOT NULL
-                        "extension_name": "jpg",                      # NOT NULL
-                        "create_at": datetime.now().strftime("%Y-%m-%d"),  # NOT NULL
-                        "delete_at": None,                            # NULL
-                        "is_delete": 0,                               # NOT NULL
-                        # 확장 필드(분석·추적)
-                        "source_url": post_url,
-                        "title": title,
-                        "slide_index": i,
-                        "slide_count": len(candidates)
-                    }
-                    records.append(meta)
-                    if remaining is not None:
-                        remaining -= 1
-
-                except Exception as e:
-                    print(f"❌ 이미지 다운로드 실패: {img_url} | {e}")
+                saved = await asyncio.gather(*(
+                    _download_slide(client, dl_sem, img_url, cat_dir) for _, img_url in batch
+                ))
+                downloaded.extend((i, fpath) for (i, _), fpath in zip(batch, saved) if fpath is not None)
+
+            for i, fpath in downloaded:
+                meta = {
+                    # file_path 테이블 스키마 기반
+                    "file_path_no": None,                         # AUTO_INCREMENT (PK)
+                    "entity_type": "CARDNEWS",                    # NOT NULL
+                    "entity_no": idx,                             # NOT NULL(임시 인덱스)
+                    "file_path": str(fpath),                      # NOT NULL
+                    "source_type": "INSTAGRAM",                   # NOT NULL
+                    "year": int(year),                            # NOT NULL
+                    "region": str(region),                        # NOT NULL
+                    "festival_name": str(festival_name),          # NOT NULL
+                    "file_name": fpath.name,                      # NOT NULL
+                    "extension_name": "jpg",                      # NOT NULL
+                    "create_at": create_at,                       # NOT NULL
+                    "delete_at": None,                            # NULL
+                    "is_delete": 0,                               # NOT NULL
+                    # 확장 필드(분석·추적)
+                    "source_url": post_url,
+                    "title": title,
+                    "slide_index": i,
+                    "slide_count": len(candidates)
+                }
+                records.append(meta)
+                if remaining is not None:
+                    remaining -= 1
 
             if remaining is not None and remaining <= 0:
                 break
@@ -1,14 +1,47 @@
 import os
 import re
+import asyncio
 from typing import List, Optional
 import httpx
 
+# orjson 이 있으면 oEmbed 응답 파싱에 사용 (없으면 표준 json)
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 FACEBOOK_APP_TOKEN = os.getenv("FACEBOOK_APP_TOKEN")  # 없으면 None
+_SRCSET_RE = re.compile(r'srcset="([^"]+)"')
+
+# graph.facebook.com 호출용 공용 AsyncClient (keep-alive 재사용)
+# - AsyncClient 는 만든 이벤트 루프에 묶이므로, 루프가 바뀌면 새로 만든다
+_oembed_client: Optional[httpx.AsyncClient] = None
+_oembed_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_client() -> httpx.AsyncClient:
+    global _oembed_client, _oembed_client_loop
+    loop = asyncio.get_running_loop()
+    if _oembed_client is None or _oembed_client.is_closed or _oembed_client_loop is not loop:
+        _oembed_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+        _oembed_client_loop = loop
+    return _oembed_client
 
-async def fetch_oembed_html(post_url: str) -> Optional[str]:
+async def close() -> None:
+    """공용 oEmbed 클라이언트 정리 (앱 종료 시 호출)"""
+    global _oembed_client, _oembed_client_loop
+    if _oembed_client is not None:
+        await _oembed_client.aclose()
+    _oembed_client = None
+    _oembed_client_loop = None
+
+async def fetch_oembed_html(post_url: str, client: Optional[httpx.AsyncClient] = None) -> Optional[str]:
     """
     Instagram oEmbed 공식 엔드포인트 호출.
     토큰이 없거나 실패하면 None 반환 (자동 폴백을 위함)
+    client 를 안 넘기면 모듈 공용 클라이언트 사용
     """
     if not FACEBOOK_APP_TOKEN:
         return None
@@ -19,15 +52,38 @@ async def fetch_oembed_html(post_url: str) -> Optional[str]:
         "access_token": FACEBOOK_APP_TOKEN
     }
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(base, params=params)
-            if resp.status_code == 200:
-                data = resp.json()
-                return data.get("html")
+        client = client or _get_client()
+        resp = await client.get(base, params=params, timeout=10.0)
+        if resp.status_code == 200:
+            body = resp.content
+            if b'"html"' not in body:  # html 필드가 없으면 파싱할 필요 없음
+                return None
+            return _json.loads(body).get("html")
     except Exception:
         pass
     return None
 
+async def fetch_oembed_html_many(
+    urls: List[str],
+    concurrency: int = 8,
+    client: Optional[httpx.AsyncClient] = None,
+) -> List[Optional[str]]:
+    """
+    여러 게시물의 oEmbed HTML을 동시에 조회 (결과 순서 = 입력 순서)
+    - 세마포어로 동시 요청 수 제한 (페이스북 rate limit 보호)
+    """
+    if not FACEBOOK_APP_TOKEN:
+        return [None] * len(urls)
+
+    sem = asyncio.Semaphore(concurrency)
+    client = client or _get_client()
+
+    async def _one(u: str) -> Optional[str]:
+        async with sem:
+            return await fetch_oembed_html(u, client=client)
+
+    return await asyncio.gather(*(_one(u) for u in urls))
+
 def extract_slide_images_from_html(html: str) -> List[str]:
     """
     oEmbed HTML에서 이미지 srcset을 파싱.
@@ -36,15 +92,12 @@ def extract_slide_images_from_html(html: str) -> List[str]:
     if not html:
         return []
     # srcset="URL1 640w, URL2 1080w" 형태 → 가장 마지막(보통 가장 큰 해상도)만 사용
-    raw = re.findall(r'srcset="([^"]+)"', html)
     urls: List[str] = []
-    for rs in raw:
-        parts = [p.strip().split(" ")[0] for p in rs.split(",") if p.strip()]
-        if parts:
-            urls.append(parts[-1])  # 가장 큰 해상도 후보를 선택
-    # 중복 제거
-    uniq = []
-    for u in urls:
-        if u not in uniq:
-            uniq.append(u)
-    return uniq
+    for rs in _SRCSET_RE.findall(html):
+        # 마지막 후보만 필요하므로 전체를 쪼개지 않고 끝에서 한 번만 자름
+        last = rs.rstrip(", \t\r\n").rpartition(",")[2].strip()
+        url = last.partition(" ")[0]
+        if url:
+            urls.append(url)  # 가장 큰 해상도 후보를 선택
+    # 중복 제거 (순서 유지)
+    return list(dict.fromkeys(urls))
@@ -3,11 +3,61 @@ from pathlib import Path
 from io import BytesIO
 from PIL import Image
 
-def download_image_from_url(url: str, save_path: str) -> str:
-    resp = requests.get(url)
-    img = Image.open(BytesIO(resp.content)).convert("RGB")
+# 순차 다운로드가 TCP/TLS 연결을 재사용하도록 모듈 공용 Session
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "acc-ai/cardnews"})
 
+# 스트리밍 저장 시 한 번에 쓰는 크기
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 받은 바이트를 그대로 저장해도 되는 (Content-Type, 확장자) 조합
+_PASSTHROUGH_SUFFIXES = {
+    "image/jpeg": (".jpg", ".jpeg"),
+    "image/png": (".png",),
+}
+
+def _can_passthrough(content_type: str | None, save_path: str) -> bool:
+    """응답 형식과 저장 확장자가 같으면 PIL 디코드/재인코딩 없이 바로 저장"""
+    mime = (content_type or "").split(";")[0].strip().lower()
+    return Path(save_path).suffix.lower() in _PASSTHROUGH_SUFFIXES.get(mime, ())
+
+def _head_is_rgb(head: bytes) -> bool:
+    """첫 청크의 헤더만 보고 RGB 이미지인지 판별 (픽셀 디코드 없음, 판별 불가면 False)"""
+    try:
+        with Image.open(BytesIO(head)) as img:
+            return img.mode == "RGB"
+    except Exception:
+        return False
+
+def download_image_from_url(url: str, save_path: str, reencode: bool = False) -> str:
+    """
+    이미지 다운로드
+    - 형식이 저장 확장자와 같고 이미 RGB 면 64KiB 단위로 바로 파일에 씀 (디코드/재인코딩 없음)
+    - 아니거나 reencode=True 면 PIL 로 RGB 변환 후 저장
+    """
     Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-    img.save(save_path)
 
+    with _SESSION.get(url, stream=True, timeout=10) as resp:
+        chunks = resp.iter_content(DOWNLOAD_CHUNK_SIZE)
+        head = next(chunks, b"")
+
+        if (
+            not reencode
+            and _can_passthrough(resp.headers.get("Content-Type"), save_path)
+            and _head_is_rgb(head)
+        ):
+            with open(save_path, "wb") as f:
+                f.write(head)
+                for chunk in chunks:
+                    f.write(chunk)
+            return save_path
+
+        data = head + b"".join(chunks)
+
+    _save_rgb(data, save_path)
     return save_path
+
+def _save_rgb(data: bytes, save_path: str) -> None:
+    img = Image.open(BytesIO(data)).convert("RGB")
+    Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+    img.save(save_path)